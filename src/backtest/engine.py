@@ -8,17 +8,55 @@ as required by TDD tests.
 import logging
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from datetime import datetime, tzinfo
 from decimal import ROUND_HALF_UP, Decimal
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
+from .kernels import EXIT_REASONS, run_rsi_backtest
+
 if TYPE_CHECKING:
     from src.backtest.models import BacktestResult
 
 logger = logging.getLogger(__name__)
 
+# Position sizing constants (hoisted out of the per-bar signal loop)
+POSITION_CASH_FRACTION = Decimal("0.9")
+QUANTITY_STEP = Decimal("0.001")
+
+
+def _to_epoch_ns(value: datetime | None) -> int | None:
+    """Convert a timestamp to int64 nanoseconds since the epoch.
+
+    Args:
+        value: datetime, pandas Timestamp or None
+
+    Returns:
+        Nanoseconds since the epoch, or None if value is None
+    """
+    if value is None:
+        return None
+    return int(pd.Timestamp(value).value)
+
+
+def _from_epoch_ns(ns: int | None, tz: tzinfo | None) -> pd.Timestamp | None:
+    """Convert int64 epoch nanoseconds back to a Timestamp in ``tz``.
+
+    Args:
+        ns: Nanoseconds since the epoch, or None
+        tz: Time zone of the original timestamp, None for naive ones
+
+    Returns:
+        Timestamp, or None if ns is None
+    """
+    if ns is None:
+        return None
+    if tz is None:
+        return pd.Timestamp(ns)
+    return pd.Timestamp(ns, tz="UTC").tz_convert(tz)
+
 
 class Trade:
     """Represents a single trade."""
@@ -61,6 +99,10 @@ class Trade:
             entry_commission: Entry commission
             exit_commission: Exit commission
             exit_reason: Reason for exit (signal/stop_loss/take_profit)
+
+        Entry and exit times are stored as int64 epoch nanoseconds in
+        ``entry_ns`` / ``exit_ns`` and exposed as pandas Timestamps in their
+        original time zone.
         """
         self.id = id or str(uuid.uuid4())
         self.symbol = symbol
@@ -79,10 +121,32 @@ class Trade:
         self.exit_commission = exit_commission or Decimal("0.0")
         self.exit_reason = exit_reason
 
-        # Calculate duration if both times are available
-        self.duration = None
-        if self.entry_time and self.exit_time:
-            self.duration = self.exit_time - self.entry_time
+    @property
+    def entry_time(self) -> pd.Timestamp | None:
+        """Entry timestamp."""
+        return _from_epoch_ns(self.entry_ns, self._entry_tz)
+
+    @entry_time.setter
+    def entry_time(self, value: datetime | None) -> None:
+        self.entry_ns = _to_epoch_ns(value)
+        self._entry_tz = None if value is None else pd.Timestamp(value).tz
+
+    @property
+    def exit_time(self) -> pd.Timestamp | None:
+        """Exit timestamp."""
+        return _from_epoch_ns(self.exit_ns, self._exit_tz)
+
+    @exit_time.setter
+    def exit_time(self, value: datetime | None) -> None:
+        self.exit_ns = _to_epoch_ns(value)
+        self._exit_tz = None if value is None else pd.Timestamp(value).tz
+
+    @property
+    def duration(self) -> pd.Timedelta | None:
+        """Holding period, available once both entry and exit times are set."""
+        if self.entry_ns is None or self.exit_ns is None:
+            return None
+        return pd.Timedelta(self.exit_ns - self.entry_ns)
 
 
 class Signal:
@@ -241,7 +305,6 @@ class Portfolio:
         trade.pnl_percent = pnl_percent
         trade.status = "closed"
         trade.exit_reason = reason
-        trade.duration = timestamp - trade.entry_time
 
         # Update portfolio
         self.cash += net_proceeds
@@ -309,6 +372,29 @@ class RSIStrategy(TradingStrategy):
         self.stop_loss_pct = stop_loss_pct
         self.take_profit_pct = take_profit_pct
 
+    @property
+    def stop_loss_pct(self) -> float:
+        """Stop loss percentage."""
+        return self._stop_loss_pct
+
+    @stop_loss_pct.setter
+    def stop_loss_pct(self, value: float) -> None:
+        # Pre-compute the Decimal price multipliers once instead of per trade
+        self._stop_loss_pct = value
+        self._long_stop_multiplier = Decimal(str(1 - value))
+        self._short_stop_multiplier = Decimal(str(1 + value))
+
+    @property
+    def take_profit_pct(self) -> float:
+        """Take profit percentage."""
+        return self._take_profit_pct
+
+    @take_profit_pct.setter
+    def take_profit_pct(self, value: float) -> None:
+        self._take_profit_pct = value
+        self._long_take_profit_multiplier = Decimal(str(1 + value))
+        self._short_take_profit_multiplier = Decimal(str(1 - value))
+
     def calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """Calculate RSI indicator.
 
@@ -389,9 +475,9 @@ class RSIStrategy(TradingStrategy):
             Stop loss price
         """
         if side == "long":
-            return entry_price * Decimal(str(1 - self.stop_loss_pct))
+            return entry_price * self._long_stop_multiplier
         else:
-            return entry_price * Decimal(str(1 + self.stop_loss_pct))
+            return entry_price * self._short_stop_multiplier
 
     def calculate_take_profit(self, entry_price: Decimal, side: str = "long") -> Decimal:
         """Calculate take profit price.
@@ -404,9 +490,9 @@ class RSIStrategy(TradingStrategy):
             Take profit price
         """
         if side == "long":
-            return entry_price * Decimal(str(1 + self.take_profit_pct))
+            return entry_price * self._long_take_profit_multiplier
         else:
-            return entry_price * Decimal(str(1 - self.take_profit_pct))
+            return entry_price * self._short_take_profit_multiplier
 
 
 class BacktestEngine:
@@ -417,6 +503,7 @@ class BacktestEngine:
         strategy: TradingStrategy,
         initial_capital: Decimal,
         commission_rate: Decimal = Decimal("0.001"),
+        use_fast_path: bool = True,
     ):
         """Initialize backtest engine.
 
@@ -424,10 +511,13 @@ class BacktestEngine:
             strategy: Trading strategy to test
             initial_capital: Starting capital
             commission_rate: Commission rate
+            use_fast_path: Find RSIStrategy trades with the fused kernel instead
+                of the per-bar signal loop (the loop stays the reference)
         """
         self.strategy = strategy
         self.initial_capital = initial_capital
         self.commission_rate = commission_rate
+        self.use_fast_path = use_fast_path
         self.portfolio = Portfolio(initial_capital, commission_rate)
 
     def run_backtest(self, market_data: pd.DataFrame, symbol: str) -> "BacktestResult":
@@ -440,14 +530,20 @@ class BacktestEngine:
         Returns:
             Backtest result object
         """
-        # Generate signals
-        signals = self.strategy.generate_signals(market_data)
+        if self._can_use_fast_path(market_data):
+            trades = self.process_rsi_kernel(market_data)
+        else:
+            # Generate signals
+            signals = self.strategy.generate_signals(market_data)
 
-        # Process signals
-        trades = self.process_signals(signals, market_data)
+            # Process signals
+            trades = self.process_signals(signals, market_data)
+
+        # Build the per-bar equity curve once and share it with every metric
+        equity_curve = self._build_portfolio_timeline(trades, market_data)
 
         # Calculate comprehensive metrics in parallel
-        metrics = self._calculate_parallel_metrics(trades, market_data)
+        metrics = self._calculate_parallel_metrics(trades, equity_curve)
 
         # Calculate metrics
         from .models import BacktestResult
@@ -466,6 +562,7 @@ class BacktestEngine:
             max_drawdown=metrics.get("max_drawdown", 0.0),
             sharpe_ratio=metrics.get("sharpe_ratio"),
             profit_factor=metrics.get("profit_factor"),
+            equity_curve=equity_curve.to_numpy(),
         )
 
         return result
@@ -485,37 +582,9 @@ class BacktestEngine:
         for i, signal_row in signals.iterrows():
             if signal_row["signal_type"] == "buy" and not self.portfolio.open_positions:
                 # Enter long position
-                market_row = market_data.iloc[i]
-                price = Decimal(str(market_row["close"]))
-
-                # Calculate position size (use 90% of available cash)
-                available_cash = self.portfolio.cash * Decimal("0.9")
-                quantity = (available_cash / price).quantize(
-                    Decimal("0.001"), rounding=ROUND_HALF_UP
-                )
-
-                if quantity > 0:
-                    # Calculate stop loss and take profit
-                    stop_loss = None
-                    take_profit = None
-
-                    if isinstance(self.strategy, RSIStrategy):
-                        stop_loss = self.strategy.calculate_stop_loss(price)
-                        take_profit = self.strategy.calculate_take_profit(price)
-
-                    try:
-                        trade = self.portfolio.buy(
-                            symbol=market_row.get("symbol", "BTC/USDT"),
-                            price=price,
-                            quantity=quantity,
-                            timestamp=signal_row["timestamp"],
-                            stop_loss=stop_loss,
-                            take_profit=take_profit,
-                        )
-                        executed_trades.append(trade)
-                    except ValueError:
-                        # Insufficient funds
-                        continue
+                trade = self._open_long(i, signal_row["timestamp"], market_data)
+                if trade is not None:
+                    executed_trades.append(trade)
 
             elif signal_row["signal_type"] == "sell" and self.portfolio.open_positions:
                 # Close positions
@@ -555,6 +624,149 @@ class BacktestEngine:
 
         return executed_trades
 
+    def process_rsi_kernel(self, market_data: pd.DataFrame) -> list[Trade]:
+        """Execute RSIStrategy trades found by the fused kernel.
+
+        The kernel decides on which bars positions open and close. Those
+        trades are then replayed through the Decimal portfolio, so sizing,
+        commissions and P&L match process_signals exactly. When the kernel
+        cannot decide a stop loss / take profit comparison, or a replayed
+        position cannot be opened, the run falls back to process_signals.
+
+        Args:
+            market_data: Market data DataFrame
+
+        Returns:
+            List of executed trades, in the same form as process_signals
+        """
+        strategy = self.strategy
+        rsi = strategy.calculate_rsi(market_data["close"], strategy.rsi_period)
+        entry_idx, exit_idx, exit_reason, open_entry, exact = run_rsi_backtest(
+            # Always fresh writable arrays: pandas may hand out read-only views,
+            # which Numba would compile as a separate signature
+            market_data["close"].to_numpy(dtype=np.float64, copy=True),
+            rsi.to_numpy(dtype=np.float64, copy=True),
+            float(strategy.oversold_threshold),
+            float(strategy.overbought_threshold),
+            float(strategy.stop_loss_pct),
+            float(strategy.take_profit_pct),
+        )
+
+        if exact:
+            bars = list(
+                zip(entry_idx.tolist(), exit_idx.tolist(), exit_reason.tolist(), strict=True)
+            )
+            if open_entry >= 0:
+                bars.append((open_entry, -1, -1))
+
+            executed_trades = self._replay_trades(bars, market_data)
+            if executed_trades is not None:
+                return executed_trades
+
+        signals = strategy.generate_signals(market_data.assign(rsi=rsi))
+        return self.process_signals(signals, market_data)
+
+    def _replay_trades(
+        self, bars: list[tuple[int, int, int]], market_data: pd.DataFrame
+    ) -> list[Trade] | None:
+        """Replay kernel trades through the portfolio.
+
+        Args:
+            bars: (entry bar, exit bar, exit reason code) per trade, with an
+                exit bar of -1 for a position left open
+            market_data: Market data DataFrame
+
+        Returns:
+            List of executed trades, or None (with the portfolio restored)
+            if a position could not be opened where the kernel assumed one
+        """
+        portfolio = self.portfolio
+        cash = portfolio.cash
+        closed_count = len(portfolio.closed_trades)
+        trade_counter = portfolio._trade_counter
+
+        timestamps = market_data["timestamp"]
+        executed_trades = []
+        for entry, exit_, reason in bars:
+            trade = self._open_long(entry, timestamps.iloc[entry], market_data)
+            if trade is None:
+                portfolio.cash = cash
+                del portfolio.closed_trades[closed_count:]
+                portfolio.open_positions.clear()
+                portfolio._trade_counter = trade_counter
+                return None
+            executed_trades.append(trade)
+
+            if exit_ >= 0:
+                price = Decimal(str(market_data["close"].iloc[exit_]))
+                reason_name = EXIT_REASONS[reason]
+                if reason_name == "stop_loss":
+                    price = min(price, trade.stop_loss)
+                elif reason_name == "take_profit":
+                    price = max(price, trade.take_profit)
+                closed_trade = portfolio.sell(
+                    trade_id=trade.id,
+                    price=price,
+                    timestamp=timestamps.iloc[exit_],
+                    reason=reason_name,
+                )
+                executed_trades.append(closed_trade)
+
+        return executed_trades
+
+    def _can_use_fast_path(self, market_data: pd.DataFrame) -> bool:
+        """Check whether the fused kernel can stand in for process_signals."""
+        return (
+            self.use_fast_path
+            # Subclasses may override signal generation
+            and type(self.strategy) is RSIStrategy
+            # generate_signals would use a precomputed RSI column as-is
+            and "rsi" not in market_data.columns
+            and not self.portfolio.open_positions
+        )
+
+    def _open_long(self, i: int, timestamp: datetime, market_data: pd.DataFrame) -> Trade | None:
+        """Open a long position at bar ``i`` using 90% of available cash.
+
+        Args:
+            i: Bar position in market_data
+            timestamp: Entry timestamp
+            market_data: Market data DataFrame
+
+        Returns:
+            Opened trade, or None if no position could be opened
+        """
+        market_row = market_data.iloc[i]
+        price = Decimal(str(market_row["close"]))
+
+        # Calculate position size (use 90% of available cash)
+        available_cash = self.portfolio.cash * POSITION_CASH_FRACTION
+        quantity = (available_cash / price).quantize(QUANTITY_STEP, rounding=ROUND_HALF_UP)
+
+        if quantity <= 0:
+            return None
+
+        # Calculate stop loss and take profit
+        stop_loss = None
+        take_profit = None
+
+        if isinstance(self.strategy, RSIStrategy):
+            stop_loss = self.strategy.calculate_stop_loss(price)
+            take_profit = self.strategy.calculate_take_profit(price)
+
+        try:
+            return self.portfolio.buy(
+                symbol=market_row.get("symbol", "BTC/USDT"),
+                price=price,
+                quantity=quantity,
+                timestamp=timestamp,
+                stop_loss=stop_loss,
+                take_profit=take_profit,
+            )
+        except ValueError:
+            # Insufficient funds
+            return None
+
     def check_stop_loss(
         self, trade: Trade, current_price: Decimal, timestamp: datetime
     ) -> Trade | None:
@@ -610,58 +822,48 @@ class BacktestEngine:
     def _calculate_max_drawdown(self, market_data: pd.DataFrame) -> float:
         """Calculate maximum drawdown."""
         # Simplified calculation
-        portfolio_values = []
-        running_value = float(self.initial_capital)
-
-        for trade in self.portfolio.closed_trades:
-            if trade.pnl:
-                running_value += float(trade.pnl)
-                portfolio_values.append(running_value)
+        pnl = [float(trade.pnl) for trade in self.portfolio.closed_trades if trade.pnl]
 
-        if not portfolio_values:
+        if not pnl:
             return 0.0
 
-        peak = portfolio_values[0]
-        max_dd = 0.0
-
-        for value in portfolio_values:
-            if value > peak:
-                peak = value
-            drawdown = (value - peak) / peak
-            max_dd = min(max_dd, drawdown)
+        portfolio_values = float(self.initial_capital) + np.cumsum(pnl)
+        peaks = np.maximum.accumulate(portfolio_values)
 
-        return max_dd
+        return float(((portfolio_values - peaks) / peaks).min())
 
     def _calculate_parallel_metrics(
-        self, trades: list[Trade], market_data: pd.DataFrame
+        self, trades: list[Trade], portfolio_values: pd.Series
     ) -> dict[str, float]:
         """Calculate all metrics in parallel.
 
         Args:
             trades: List of completed trades
-            market_data: Market data DataFrame
+            portfolio_values: Per-bar portfolio value series
 
         Returns:
             Dictionary of calculated metrics
         """
-        from .metrics import PerformanceMetrics, RiskMetrics, TradeAnalyzer
+        from .metrics import PerformanceMetrics, RiskMetrics, TradeAnalyzer, trades_to_frame
 
         # Prepare data for metrics calculation
-        portfolio_values = self._build_portfolio_timeline(trades, market_data)
         returns = (
             portfolio_values.pct_change().dropna() if len(portfolio_values) > 1 else pd.Series()
         )
 
+        # Convert trades once; the trade-based metrics share the same frame
+        trade_frame = trades_to_frame(trades)
+
         # Initialize metric calculators
-        perf_metrics = PerformanceMetrics(self.initial_capital)
+        perf_metrics = PerformanceMetrics(self.initial_capital, trade_frame)
         risk_metrics = RiskMetrics()
         trade_analyzer = TradeAnalyzer()
 
         # Define parallel metric calculations
         def calculate_performance_metrics():
             return {
-                "win_rate": perf_metrics.calculate_win_rate(trades),
-                "profit_factor": perf_metrics.calculate_profit_factor(trades),
+                "win_rate": perf_metrics.calculate_win_rate(),
+                "profit_factor": perf_metrics.calculate_profit_factor(),
                 "max_drawdown": perf_metrics.calculate_max_drawdown(portfolio_values),
                 "sharpe_ratio": (
                     perf_metrics.calculate_sharpe_ratio(returns) if not returns.empty else 0.0
@@ -681,7 +883,7 @@ class BacktestEngine:
             }
 
         def calculate_trade_analysis():
-            analysis = trade_analyzer.analyze_trades(trades)
+            analysis = trade_analyzer.analyze_trades(trades, trade_frame)
             drawdown_analysis = trade_analyzer.analyze_drawdown_periods(portfolio_values)
             return {
                 "avg_win": analysis.get("avg_win", 0.0),
@@ -716,33 +918,38 @@ class BacktestEngine:
     def _build_portfolio_timeline(
         self, trades: list[Trade], market_data: pd.DataFrame
     ) -> pd.Series:
-        """Build portfolio value timeline from trades.
+        """Build per-bar portfolio value timeline from trades.
+
+        Realised P&L is scattered onto the bar each trade exits on and the
+        equity curve is the running sum on top of the initial capital.
 
         Args:
             trades: List of completed trades
             market_data: Market data DataFrame
 
         Returns:
-            Series of portfolio values over time
+            Series of portfolio values indexed by bar timestamp
         """
-        if not trades:
-            return pd.Series(
-                [float(self.initial_capital)], index=[market_data["timestamp"].iloc[0]]
+        timestamps = market_data["timestamp"]
+        bar_ns = timestamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        bar_pnl = np.zeros(len(timestamps))
+
+        # process_signals reports a trade both on entry and on exit, so dedupe by id
+        closed_trades = {
+            trade.id: trade
+            for trade in trades
+            if trade.exit_ns is not None and trade.pnl is not None
+        }
+
+        if closed_trades:
+            exit_ns = np.fromiter(
+                (trade.exit_ns for trade in closed_trades.values()),
+                dtype=np.int64,
+                count=len(closed_trades),
             )
+            exit_idx = np.minimum(np.searchsorted(bar_ns, exit_ns), len(timestamps) - 1)
+            pnl = np.array([float(trade.pnl) for trade in closed_trades.values()])
+            np.add.at(bar_pnl, exit_idx, pnl)
 
-        # Sort trades by entry time
-        sorted_trades = sorted([t for t in trades if t.entry_time], key=lambda x: x.entry_time)
-
-        # Build timeline
-        timeline = {}
-        running_value = float(self.initial_capital)
-        timeline[market_data["timestamp"].iloc[0]] = running_value
-
-        for trade in sorted_trades:
-            if trade.exit_time and trade.pnl:
-                running_value += float(trade.pnl)
-                timeline[trade.exit_time] = running_value
-
-        # Convert to Series and sort by index
-        portfolio_series = pd.Series(timeline).sort_index()
-        return portfolio_series
+        equity = float(self.initial_capital) + np.cumsum(bar_pnl)
+        return pd.Series(equity, index=pd.DatetimeIndex(timestamps))
@@ -0,0 +1,113 @@
+"""
+Fused backtest kernels.
+
+Runs signal generation and stop loss / take profit exits in a single pass
+over the close prices, mirroring the logic of RSIStrategy.generate_signals
+and BacktestEngine.process_signals. BacktestEngine uses it to find the
+trade bars for RSIStrategy and replays them through the Decimal portfolio.
+Compiled with Numba when it is installed.
+"""
+
+import numpy as np
+
+from src.jit import njit
+
+# Exit reason codes returned by run_rsi_backtest
+EXIT_SIGNAL = 0
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+
+EXIT_REASONS = {
+    EXIT_SIGNAL: "signal",
+    EXIT_STOP_LOSS: "stop_loss",
+    EXIT_TAKE_PROFIT: "take_profit",
+}
+
+# Relative distance from a stop loss / take profit level below which the
+# float comparison may disagree with the Decimal one
+LEVEL_TOLERANCE = 1e-9
+
+
+@njit(cache=True)
+def run_rsi_backtest(
+    close: np.ndarray,
+    rsi: np.ndarray,
+    oversold: float,
+    overbought: float,
+    stop_loss_pct: float,
+    take_profit_pct: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, int, bool]:
+    """Find the trade bars of an RSI long-only backtest in one pass.
+
+    Takes the RSI values from RSIStrategy.calculate_rsi, so signals are
+    identical to generate_signals. Every buy signal is assumed to open a
+    position, which is closed on an overbought signal, stop loss or take
+    profit. Stop loss and take profit levels are compared in float64; a
+    price within LEVEL_TOLERANCE of a level makes the result inexact, as
+    the Decimal comparison in process_signals could go either way.
+
+    Args:
+        close: Close prices as float64 array
+        rsi: RSI values as float64 array (NaN during warmup)
+        oversold: Oversold threshold for entries
+        overbought: Overbought threshold for exits
+        stop_loss_pct: Stop loss percentage (e.g., 0.02 = 2%)
+        take_profit_pct: Take profit percentage (e.g., 0.04 = 4%)
+
+    Returns:
+        Tuple of (entry_idx, exit_idx, exit_reason) arrays, one entry per
+        closed trade, the entry bar of the position still open at the end
+        (-1 if none), and whether every level comparison was decisive
+    """
+    n = close.shape[0]
+    entry_idx = np.empty(n, dtype=np.int64)
+    exit_idx = np.empty(n, dtype=np.int64)
+    exit_reason = np.empty(n, dtype=np.int8)
+    n_trades = 0
+
+    in_position = False
+    entry_bar = 0
+    stop_price = 0.0
+    target_price = 0.0
+    exact = True
+
+    for i in range(n):
+        price = close[i]
+        value = rsi[i]
+        reason = -1
+
+        # NaN compares false against both thresholds and holds
+        if value <= oversold:
+            if not in_position:
+                in_position = True
+                entry_bar = i
+                stop_price = price * (1.0 - stop_loss_pct)
+                target_price = price * (1.0 + take_profit_pct)
+        elif value >= overbought and in_position:
+            reason = EXIT_SIGNAL
+
+        if in_position and reason < 0:
+            tolerance = LEVEL_TOLERANCE * price
+            if abs(price - stop_price) <= tolerance or abs(price - target_price) <= tolerance:
+                exact = False
+                break
+            if price <= stop_price:
+                reason = EXIT_STOP_LOSS
+            elif price >= target_price:
+                reason = EXIT_TAKE_PROFIT
+
+        if reason >= 0:
+            entry_idx[n_trades] = entry_bar
+            exit_idx[n_trades] = i
+            exit_reason[n_trades] = reason
+            n_trades += 1
+            in_position = False
+
+    open_entry = entry_bar if in_position else -1
+    return (
+        entry_idx[:n_trades],
+        exit_idx[:n_trades],
+        exit_reason[:n_trades],
+        open_entry,
+        exact,
+    )
@@ -11,21 +11,54 @@ from datetime import timedelta
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
+def trades_to_frame(trades: list[Any] | pd.DataFrame) -> pd.DataFrame:
+    """Materialize trades as a DataFrame with a float ``pnl`` column.
+
+    Trades without a P&L get NaN so they never count as wins or losses.
+
+    Args:
+        trades: List of Trade objects, or an already converted DataFrame
+
+    Returns:
+        DataFrame with one row per trade
+    """
+    if isinstance(trades, pd.DataFrame):
+        return trades
+
+    pnl = np.fromiter(
+        (np.nan if trade.pnl is None else float(trade.pnl) for trade in trades),
+        dtype=np.float64,
+        count=len(trades),
+    )
+    return pd.DataFrame({"pnl": pnl})
+
+
 class PerformanceMetrics:
     """Calculate trading performance metrics."""
 
-    def __init__(self, initial_capital: Decimal):
+    def __init__(self, initial_capital: Decimal, trades: list[Any] | pd.DataFrame | None = None):
         """Initialize metrics calculator.
 
         Args:
             initial_capital: Starting portfolio capital
+            trades: Trades to cache as a DataFrame for the trade-based metrics
         """
         self.initial_capital = initial_capital
+        self._trade_frame = trades_to_frame(trades) if trades is not None else None
+
+    def _trade_pnl(self, trades: list[Any] | pd.DataFrame | None) -> pd.Series:
+        """Get the P&L column for the given trades, or the cached ones."""
+        if trades is None:
+            if self._trade_frame is None:
+                return pd.Series(dtype=np.float64)
+            return self._trade_frame["pnl"]
+        return trades_to_frame(trades)["pnl"]
 
     def calculate_total_return(self, final_value: Decimal) -> Decimal:
         """Calculate total return percentage.
@@ -38,20 +71,20 @@ class PerformanceMetrics:
         """
         return (final_value - self.initial_capital) / self.initial_capital
 
-    def calculate_win_rate(self, trades: list[Any]) -> float:
+    def calculate_win_rate(self, trades: list[Any] | pd.DataFrame | None = None) -> float:
         """Calculate win rate from trades.
 
         Args:
-            trades: List of Trade objects
+            trades: List of Trade objects or trade DataFrame (defaults to cached trades)
 
         Returns:
             Win rate as decimal (0.0 to 1.0)
         """
-        if not trades:
+        pnl = self._trade_pnl(trades)
+        if pnl.empty:
             return 0.0
 
-        winning_trades = sum(1 for trade in trades if trade.pnl and trade.pnl > 0)
-        return winning_trades / len(trades)
+        return float((pnl > 0).sum() / len(pnl))
 
     def calculate_sharpe_ratio(
         self, returns: pd.Series, risk_free_rate: float = 0.02, periods_per_year: int = 252
@@ -95,21 +128,21 @@ class PerformanceMetrics:
 
         return float(drawdown.min())
 
-    def calculate_profit_factor(self, trades: list[Any]) -> float:
+    def calculate_profit_factor(self, trades: list[Any] | pd.DataFrame | None = None) -> float:
         """Calculate profit factor.
 
         Args:
-            trades: List of Trade objects
+            trades: List of Trade objects or trade DataFrame (defaults to cached trades)
 
         Returns:
             Profit factor (gross profit / gross loss)
         """
-        if not trades:
+        pnl = self._trade_pnl(trades)
+        if pnl.empty:
             return 0.0
 
-        gross_profit = sum(float(trade.pnl) for trade in trades if trade.pnl and trade.pnl > 0)
-
-        gross_loss = abs(sum(float(trade.pnl) for trade in trades if trade.pnl and trade.pnl < 0))
+        gross_profit = float(pnl[pnl > 0].sum())
+        gross_loss = -float(pnl[pnl < 0].sum())
 
         if gross_loss == 0:
             return float("inf") if gross_profit > 0 else 0.0
@@ -208,11 +241,14 @@ class TradeAnalyzer:
         """Initialize trade analyzer."""
         pass
 
-    def analyze_trades(self, trades: list[Any]) -> dict[str, Any]:
+    def analyze_trades(
+        self, trades: list[Any], trade_frame: pd.DataFrame | None = None
+    ) -> dict[str, Any]:
         """Analyze trade statistics.
 
         Args:
             trades: List of Trade objects
+            trade_frame: Trades already converted with trades_to_frame
 
         Returns:
             Dictionary with trade analysis
@@ -230,24 +266,18 @@ class TradeAnalyzer:
                 "avg_duration": timedelta(0),
             }
 
-        winning_trades = [t for t in trades if t.pnl and t.pnl > 0]
-        losing_trades = [t for t in trades if t.pnl and t.pnl < 0]
-
-        avg_win = (
-            sum(float(t.pnl) for t in winning_trades) / len(winning_trades)
-            if winning_trades
-            else 0.0
-        )
+        pnl = trades_to_frame(trades if trade_frame is None else trade_frame)["pnl"]
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
 
-        avg_loss = (
-            sum(float(t.pnl) for t in losing_trades) / len(losing_trades) if losing_trades else 0.0
-        )
+        avg_win = float(wins.mean()) if not wins.empty else 0.0
+        avg_loss = float(losses.mean()) if not losses.empty else 0.0
 
         return {
             "total_trades": len(trades),
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
-            "win_rate": len(winning_trades) / len(trades),
+            "winning_trades": len(wins),
+            "losing_trades": len(losses),
+            "win_rate": len(wins) / len(trades),
             "avg_win": avg_win,
             "avg_loss": avg_loss,
             "best_trade": self.find_best_trade(trades),
@@ -296,26 +326,13 @@ class TradeAnalyzer:
         Returns:
             Average trade duration
         """
-        durations = []
-
-        for trade in trades:
-            if hasattr(trade, "duration") and trade.duration:
-                durations.append(trade.duration)
-            elif (
-                hasattr(trade, "entry_time")
-                and hasattr(trade, "exit_time")
-                and trade.entry_time
-                and trade.exit_time
-            ):
-                durations.append(trade.exit_time - trade.entry_time)
-
-        if not durations:
-            return timedelta(0)
-
-        total_seconds = sum(d.total_seconds() for d in durations)
-        avg_seconds = total_seconds / len(durations)
-
-        return timedelta(seconds=avg_seconds)
+        closed = [t for t in trades if t.entry_ns is not None and t.exit_ns is not None]
+        if not closed:
+            return pd.Timedelta(0)
+
+        entry_ns = np.fromiter((t.entry_ns for t in closed), dtype=np.int64, count=len(closed))
+        exit_ns = np.fromiter((t.exit_ns for t in closed), dtype=np.int64, count=len(closed))
+        return pd.Timedelta(int((exit_ns - entry_ns).mean()))
 
     def analyze_drawdown_periods(self, equity_curve: pd.Series) -> dict[str, Any]:
         """Analyze drawdown periods.
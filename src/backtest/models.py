@@ -5,11 +5,13 @@ Defines BacktestResult, StrategyParameters, and other data structures
 as required by TDD tests.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
+
 
 @dataclass
 class BacktestResult:
@@ -28,6 +30,7 @@ class BacktestResult:
     max_drawdown: float = 0.0
     sharpe_ratio: float | None = None
     profit_factor: float | None = None
+    equity_curve: np.ndarray | None = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Calculate derived metrics after initialization."""
@@ -7,29 +7,59 @@ as required by TDD tests.
 
 import logging
 import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 logger = logging.getLogger(__name__)
 
+# Arrow schema for OHLCV frames; exchange timestamps are millisecond epochs
+OHLCV_SCHEMA = pa.schema(
+    [
+        ("timestamp", pa.timestamp("ms")),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.float64()),
+    ]
+)
+
 
 class ParquetStorage:
     """Parquet file storage for OHLCV data."""
 
-    def __init__(self, data_dir: str | Path = "data/", compression: str = "snappy"):
+    def __init__(
+        self,
+        data_dir: str | Path = "data/",
+        compression: str = "snappy",
+        writer: Callable[..., None] = pq.write_table,
+    ):
         """Initialize Parquet storage.
 
         Args:
             data_dir: Directory to store data files
-            compression: Compression algorithm (snappy, gzip, brotli)
+            compression: Compression algorithm (snappy, zstd, lz4, gzip, brotli)
+            writer: Table writer with the pq.write_table(table, where, compression=...)
+                signature
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.compression = compression
-
-    def save(self, data: pd.DataFrame, symbol: str, timeframe: str, limit: int) -> Path:
+        self.writer = writer
+
+    def save(
+        self,
+        data: pd.DataFrame,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        schema: pa.Schema | None = None,
+    ) -> Path:
         """Save DataFrame to Parquet file.
 
         Args:
@@ -37,6 +67,7 @@ class ParquetStorage:
             symbol: Trading pair symbol (without slash)
             timeframe: Timeframe (e.g., "1d", "4h")
             limit: Number of bars
+            schema: Arrow schema to skip inference (e.g., OHLCV_SCHEMA)
 
         Returns:
             Path to saved file
@@ -51,7 +82,7 @@ class ParquetStorage:
             self._check_disk_space(file_path.parent)
 
             # Save with compression
-            data.to_parquet(file_path, compression=self.compression, index=False)
+            self.write(data, file_path, schema=schema)
 
             logger.info(f"Data saved to {file_path}")
             return file_path
@@ -81,17 +112,47 @@ class ParquetStorage:
             raise FileNotFoundError(f"Data file not found: {file_path}")
 
         try:
-            data = pd.read_parquet(file_path)
-
-            # Basic validation
-            if data.empty:
-                raise ValueError("Loaded data is empty")
-
-            return data
+            return self.read(file_path)
 
         except Exception as e:
             raise ValueError(f"Failed to load data: {str(e)}") from e
 
+    def write(
+        self,
+        data: pd.DataFrame,
+        sink: str | Path | pa.NativeFile,
+        schema: pa.Schema | None = None,
+    ) -> None:
+        """Write DataFrame as compressed Parquet.
+
+        Args:
+            data: OHLCV DataFrame to write
+            sink: File path or Arrow output stream (e.g., pa.BufferOutputStream)
+            schema: Arrow schema to skip inference (e.g., OHLCV_SCHEMA)
+        """
+        table = pa.Table.from_pandas(data, schema=schema, preserve_index=False)
+        self.writer(table, sink, compression=self.compression)
+
+    def read(self, source: str | Path | pa.NativeFile) -> pd.DataFrame:
+        """Read DataFrame from Parquet.
+
+        Args:
+            source: File path or Arrow input stream (e.g., pa.BufferReader)
+
+        Returns:
+            Loaded DataFrame
+
+        Raises:
+            ValueError: If the data is empty
+        """
+        data = pd.read_parquet(source)
+
+        # Basic validation
+        if data.empty:
+            raise ValueError("Loaded data is empty")
+
+        return data
+
     def get_filename(self, symbol: str, timeframe: str, limit: int) -> Path:
         """Get standardized filename for data file.
 
@@ -0,0 +1,60 @@
+"""
+Optional Numba JIT support.
+
+Exposes an ``njit`` decorator that compiles with Numba when it is
+installed, otherwise leaves jitted kernels running as plain Python.
+Numba itself is imported on the first call of a decorated kernel, so
+importing modules that define kernels stays cheap.
+"""
+
+import functools
+import importlib.util
+from collections.abc import Callable
+from typing import Any
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+@functools.cache
+def _numba() -> Any:
+    """Import Numba on first use."""
+    import numba
+
+    return numba
+
+
+class _LazyJit:
+    """Kernel wrapper that compiles the function on its first call.
+
+    Decorated kernels can only be called from Python, not from other
+    jitted functions.
+    """
+
+    def __init__(self, func: Callable, options: dict[str, Any]) -> None:
+        functools.update_wrapper(self, func)
+        self.py_func = func
+        self._options = options
+        self._compiled: Callable | None = None
+
+    def __call__(self, *args: Any) -> Any:
+        compiled = self._compiled
+        if compiled is None:
+            if NUMBA_AVAILABLE:
+                compiled = _numba().njit(**self._options)(self.py_func)
+            else:
+                compiled = self.py_func
+            self._compiled = compiled
+        return compiled(*args)
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Decorate a kernel for lazy Numba compilation.
+
+    Supports both ``@njit`` and ``@njit(cache=True, ...)``.
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return _LazyJit(args[0], {})
+    return lambda func: _LazyJit(func, kwargs)
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit"]
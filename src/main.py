@@ -6,6 +6,7 @@ as required by TDD tests and quickstart.md specifications.
 """
 
 import argparse
+import functools
 import logging
 import sys
 import traceback
@@ -459,14 +460,12 @@ class BacktestCLI:
             return 1
 
 
-def parse_arguments(args_list: list | None = None) -> argparse.Namespace:
-    """Parse command line arguments.
-
-    Args:
-        args_list: Optional list of arguments (for testing)
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once and reuse it.
 
     Returns:
-        Parsed arguments
+        Argument parser with backtest, download and validate subcommands
     """
     parser = argparse.ArgumentParser(
         description="Cryptocurrency Backtesting System",
@@ -509,6 +508,20 @@ def parse_arguments(args_list: list | None = None) -> argparse.Namespace:
     validate_parser = subparsers.add_parser("validate", help="Validate Pine Script")
     validate_parser.add_argument("--file", required=True, help="Pine Script file to validate")
 
+    return parser
+
+
+def parse_arguments(args_list: list | None = None) -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Args:
+        args_list: Optional list of arguments (for testing)
+
+    Returns:
+        Parsed arguments
+    """
+    parser = _build_parser()
+
     # Parse arguments
     if args_list is not None:
         return parser.parse_args(args_list)
@@ -5,10 +5,18 @@ Implements PineScriptValidator, StrategyAnalyzer, and related classes
 as required by TDD tests.
 """
 
+import dataclasses
+import functools
 import re
-from dataclasses import dataclass
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, TypeVar
+
+import numpy as np
+
+from src.jit import NUMBA_AVAILABLE, njit
 
 
 class PineScriptError(Exception):
@@ -17,48 +25,293 @@ class PineScriptError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationResult:
-    """Result of Pine Script validation."""
+    """Result of Pine Script validation.
+
+    Cached results are handed out with fresh copies of their lists, so a
+    caller can modify them without affecting later cache hits. The
+    parameter mappings are read-only views shared by every copy.
+    """
 
     is_valid: bool = False
     version: str | None = None
-    errors: list[str] | None = None
-    warnings: list[str] | None = None
-    declarations: list[str] | None = None
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    declarations: list[str] = field(default_factory=list)
+    functions_called: frozenset[str] = frozenset()
     strategy_name: str | None = None
-    strategy_params: dict[str, Any] | None = None
-    input_params: dict[str, dict[str, Any]] | None = None
+    strategy_params: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    input_params: Mapping[str, Mapping[str, Any]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
     has_entry_conditions: bool = False
     has_exit_conditions: bool = False
-    entry_methods: list[str] | None = None
-    exit_methods: list[str] | None = None
+    entry_methods: list[str] = field(default_factory=list)
+    exit_methods: list[str] = field(default_factory=list)
     has_stop_loss: bool = False
     has_take_profit: bool = False
     stop_loss_method: str | None = None
     take_profit_method: str | None = None
     has_position_checks: bool = False
-    position_checks: list[str] | None = None
+    position_checks: list[str] = field(default_factory=list)
     prevents_multiple_entries: bool = False
 
-    def __post_init__(self) -> None:
-        """Initialize empty lists."""
-        if self.errors is None:
-            self.errors = []
-        if self.warnings is None:
-            self.warnings = []
-        if self.declarations is None:
-            self.declarations = []
-        if self.strategy_params is None:
-            self.strategy_params = {}
-        if self.input_params is None:
-            self.input_params = {}
-        if self.entry_methods is None:
-            self.entry_methods = []
-        if self.exit_methods is None:
-            self.exit_methods = []
-        if self.position_checks is None:
-            self.position_checks = []
+
+# Patterns compiled once at import and shared by every validator instance
+_VERSION = re.compile(r"//@version=(\d+)")
+_VERSION_BYTES = re.compile(rb"//@version=(\d+)")
+_INPUT_INT = re.compile(r"(\w+)\s*=\s*input\.int\((\d+)")
+
+# Substrings that mark each template section as present
+_SECTION_MARKERS = {
+    "version_declaration": ("//@version=",),
+    "strategy_declaration": ("strategy(",),
+    "input_parameters": ("input.",),
+    "indicator_calculations": ("ta.", "rsi"),
+    "entry_conditions": ("strategy.entry",),
+    "exit_conditions": ("strategy.exit", "strategy.close"),
+    "plotting": ("plot(",),
+}
+
+# Single-pass tokenizer shared by PineScriptValidator and PineParser
+_TOKEN = re.compile(
+    r"""
+    (?P<version>//@version=\d+)
+  | (?P<comment>//[^\n]*)
+  | (?P<string>"(?:\\.|[^"\\\n])*")
+  | (?P<call>[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)\s*\(
+  | (?P<name>[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)
+  | (?P<number>\d+(?:\.\d*)?)
+  | (?P<compare>==|!=|<=|>=)
+  | (?P<assign>:=|=)
+  | (?P<close>\))
+  | (?P<open>\()
+  | (?P<comma>,)
+  | (?P<newline>\n)
+    """,
+    re.VERBOSE,
+)
+
+# Namespaced calls for PineParser.extract_functions. Strings and comments are
+# matched (without a group) so calls inside them are skipped like the tokenizer does.
+_DOTTED_CALL = re.compile(
+    rb"""
+    "(?:\\.|[^"\\\n])*"
+  | //[^\n]*
+  | ([A-Za-z_][\w\x80-\xff]*(?:\.[A-Za-z_][\w\x80-\xff]*)+)\s*\(
+    """,
+    re.VERBOSE,
+)
+
+# Words that may be followed by "(" without being a function call
+_KEYWORDS = frozenset({"if", "else", "and", "or", "not", "for", "while", "switch"})
+
+Span = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class VersionEvent:
+    """``//@version=N`` comment."""
+
+    version: str
+
+
+@dataclass(frozen=True)
+class CallEvent:
+    """Function call, emitted when its closing parenthesis is reached."""
+
+    name: str
+    span: Span
+    target: str | None
+    args: tuple[Span, ...]
+    kwargs: dict[str, Span]
+
+
+@dataclass(frozen=True)
+class AssignEvent:
+    """Top-level ``name = expr`` or ``name := expr`` statement."""
+
+    name: str
+    rhs_span: Span
+
+
+@dataclass(frozen=True)
+class IfEvent:
+    """Top-level ``if`` statement."""
+
+    cond_span: Span
+
+
+@dataclass(frozen=True)
+class NameEvent:
+    """Identifier that is not called."""
+
+    name: str
+
+
+@dataclass(frozen=True)
+class CompareEvent:
+    """Comparison between two adjacent operands."""
+
+    left: str
+    op: str
+    right: str
+
+
+Event = VersionEvent | CallEvent | AssignEvent | IfEvent | NameEvent | CompareEvent
+
+
+@dataclass
+class _OpenGroup:
+    """Parenthesis group tracked by the tokenizer (``name`` is None for grouping)."""
+
+    name: str | None
+    start: int
+    target: str | None = None
+    arg_start: int = 0
+    arg_tokens: int = 0
+    candidate: str | None = None
+    keyword: str | None = None
+    args: list[Span] = field(default_factory=list)
+    kwargs: dict[str, Span] = field(default_factory=dict)
+
+    def end_arg(self, end: int) -> None:
+        """Record the argument spanning arg_start..end."""
+        if self.keyword is not None:
+            self.kwargs[self.keyword] = (self.arg_start, end)
+        elif self.arg_tokens:
+            self.args.append((self.arg_start, end))
+        self.arg_tokens = 0
+        self.candidate = None
+        self.keyword = None
+
+
+def _tokenize(content: str) -> Iterator[Event]:
+    """Walk Pine Script source once and yield structural events.
+
+    Comments and string contents are skipped, parentheses are tracked so
+    multi-line calls stay one statement, and events carry spans into
+    ``content`` rather than substrings.
+
+    Args:
+        content: Pine Script source code
+
+    Yields:
+        Events in source order (calls are yielded when they close)
+    """
+    stack: list[_OpenGroup] = []
+    statement: tuple[str, str | None, int] | None = None
+    last_name: str | None = None
+    target: str | None = None
+    previous: str | None = None
+    comparison: tuple[str, str] | None = None
+    last_end = 0
+
+    for match in _TOKEN.finditer(content):
+        kind = match.lastgroup
+        text = match.group(kind)
+        top = stack[-1] if stack else None
+
+        if kind == "comment":
+            continue
+        if kind == "version":
+            yield VersionEvent(text.partition("=")[2])
+            continue
+        if kind == "newline":
+            if not stack:
+                if statement is not None:
+                    yield _close_statement(statement, last_end)
+                statement, last_name, target, previous = None, None, None, None
+            continue
+
+        last_end = match.end()
+        if top is not None and top.name is not None and kind not in ("comma", "close"):
+            top.arg_tokens += 1
+
+        opens_group = kind == "call" and text in _KEYWORDS
+        if opens_group:
+            kind = "name"
+        elif kind == "call":
+            stack.append(
+                _OpenGroup(text, match.start(), target if top is None else None, match.end())
+            )
+            previous = text
+            continue
+
+        if kind == "name":
+            if not stack and statement is None:
+                if text == "if":
+                    statement = ("if", None, match.start() + len(text))
+                elif text != "else":
+                    last_name = text
+            if top is not None and top.name is not None and top.arg_tokens == 1:
+                top.candidate = text
+            if opens_group:
+                stack.append(_OpenGroup(None, match.end()))
+            elif text not in _KEYWORDS:
+                yield NameEvent(text)
+        elif kind == "open":
+            stack.append(_OpenGroup(None, match.start()))
+        elif kind == "close":
+            if top is None:
+                continue
+            stack.pop()
+            if top.name is not None:
+                top.end_arg(match.start())
+                yield CallEvent(
+                    top.name,
+                    (top.start, match.end()),
+                    top.target,
+                    tuple(top.args),
+                    top.kwargs,
+                )
+            previous = ")"
+            continue
+        elif kind == "comma":
+            if top is not None and top.name is not None:
+                top.end_arg(match.start())
+                top.arg_start = match.end()
+            continue
+        elif kind == "assign":
+            if top is not None and top.name is not None:
+                if top.arg_tokens == 2 and top.candidate is not None:
+                    top.keyword = top.candidate
+                    top.arg_start = match.end()
+            elif not stack and statement is None and last_name is not None:
+                statement = ("assign", last_name, match.end())
+                target = last_name
+            continue
+        elif kind == "compare":
+            if previous is not None:
+                comparison = (previous, text)
+            continue
+
+        if kind in ("name", "number", "string"):
+            if comparison is not None:
+                yield CompareEvent(comparison[0], comparison[1], text)
+                comparison = None
+            previous = text
+
+    # Flush calls left open by unbalanced parentheses
+    while stack:
+        group = stack.pop()
+        if group.name is not None:
+            group.end_arg(last_end)
+            yield CallEvent(
+                group.name, (group.start, last_end), group.target, tuple(group.args), group.kwargs
+            )
+
+    if statement is not None:
+        yield _close_statement(statement, last_end)
+
+
+def _close_statement(statement: tuple[str, str | None, int], end: int) -> Event:
+    """Build the event for a finished top-level statement."""
+    kind, name, start = statement
+    if kind == "if":
+        return IfEvent((start, end))
+    return AssignEvent(name, (start, end))
 
 
 class PineScriptValidator:
@@ -72,101 +325,151 @@ class PineScriptValidator:
         """
         self.required_version = required_version
 
-    def validate_file(self, file_path: Path) -> ValidationResult:
+    def validate_file(self, file_path: Path, *, full: bool = True) -> ValidationResult:
         """Validate Pine Script file.
 
         Args:
             file_path: Path to Pine Script file
+            full: Extract strategy details; when False only is_valid, version
+                and errors are filled in
 
         Returns:
             Validation result
         """
         try:
-            content = file_path.read_text()
-            return self.validate_script(content)
+            return self.validate_script(file_path.read_bytes(), full=full)
         except FileNotFoundError:
-            result = ValidationResult()
-            result.errors.append(f"File not found: {file_path}")
-            return result
+            return ValidationResult(errors=[f"File not found: {file_path}"])
         except Exception as e:
-            result = ValidationResult()
-            result.errors.append(f"Error reading file: {str(e)}")
-            return result
+            return ValidationResult(errors=[f"Error reading file: {str(e)}"])
 
-    def validate_script(self, content: str) -> ValidationResult:
+    def validate_script(self, content: str | bytes, *, full: bool = True) -> ValidationResult:
         """Validate Pine Script content.
 
         Args:
-            content: Pine Script source code
+            content: Pine Script source code, as text or UTF-8 bytes
+            full: Extract strategy details; when False only is_valid, version
+                and errors are filled in
 
         Returns:
             Validation result
         """
-        result = ValidationResult()
+        handle = _ConfiguredValidator(self)
+        try:
+            hash(handle)
+        except TypeError:
+            # Unhashable configuration; validate without the cache
+            return handle.run(content, full)
+        return _unshared(_validate_cached(handle, content, full))
 
-        # Check version
-        version_check = self.check_version(content)
-        result.version = version_check.get("version")
+    def is_valid(self, content: str | bytes) -> bool:
+        """Check whether Pine Script content passes validation.
+
+        Args:
+            content: Pine Script source code, as text or UTF-8 bytes
+
+        Returns:
+            True if the script is valid
+        """
+        return self.validate_script(content, full=False).is_valid
+
+    def _check(self, content: str | bytes) -> tuple[str | None, list[str], str | None]:
+        """Run the version, syntax and structure checks.
 
+        The version is checked first on the raw source, so scripts with a
+        missing or wrong version are rejected before any decoding or scanning.
+
+        Args:
+            content: Source as passed by the caller (bytes are scanned without re-encoding)
+
+        Returns:
+            Tuple of (version, errors, source decoded to text or None when the
+            version or syntax checks or decoding failed)
+        """
+        version_check = self.check_version(content)
+        version = version_check.get("version")
         if not version_check.get("valid"):
-            result.errors.extend(version_check.get("errors", []))
-            return result
+            return version, list(version_check.get("errors", [])), None
 
-        # Check syntax
         syntax_check = self.validate_syntax(content)
         if not syntax_check.get("valid"):
-            result.errors.extend(syntax_check.get("errors", []))
-            return result
-
-        # Check strategy structure
-        structure_check = self.validate_strategy_structure(content)
-        if not structure_check.get("valid"):
-            result.errors.extend(structure_check.get("errors", []))
-
-        # Extract information
-        result.declarations = self._extract_declarations(content)
-        result.strategy_name = self._extract_strategy_name(content)
-        result.strategy_params = self._extract_strategy_params(content)
-        result.input_params = self._extract_input_params(content)
-
-        # Analyze entry/exit logic
-        result.has_entry_conditions = "strategy.entry" in content
-        result.has_exit_conditions = "strategy.exit" in content or "strategy.close" in content
-        result.entry_methods = self._extract_entry_methods(content)
-        result.exit_methods = self._extract_exit_methods(content)
-
-        # Analyze risk management
-        result.has_stop_loss = "stop_loss" in content or "stop=" in content
-        result.has_take_profit = "take_profit" in content or "limit=" in content
-        result.stop_loss_method = "percentage" if "stop_loss_pct" in content else None
-        result.take_profit_method = "percentage" if "take_profit_pct" in content else None
-
-        # Analyze position management
-        result.has_position_checks = "strategy.position_size" in content
-        result.position_checks = ["strategy.position_size"] if result.has_position_checks else []
-        result.prevents_multiple_entries = "strategy.position_size == 0" in content
-
-        # Set valid if no errors
-        result.is_valid = len(result.errors) == 0
-
-        return result
-
-    def check_version(self, content: str) -> dict[str, Any]:
+            return version, list(syntax_check.get("errors", [])), None
+
+        try:
+            text = _as_text(content)
+        except UnicodeDecodeError as e:
+            return version, [f"Invalid UTF-8 source: {e}"], None
+        return version, list(self.validate_strategy_structure(text).get("errors", [])), text
+
+    def _validate_fast(self, content: str | bytes) -> ValidationResult:
+        """Validate without extracting strategy details."""
+        version, errors, _ = self._check(content)
+        return ValidationResult(is_valid=len(errors) == 0, version=version, errors=errors)
+
+    def _validate(self, content: str | bytes) -> ValidationResult:
+        """Validate and extract strategy details without consulting the cache."""
+        version, errors, text = self._check(content)
+        if text is None:
+            return ValidationResult(version=version, errors=errors)
+
+        # Extract information in a single pass over the source
+        draft = SimpleNamespace(
+            strategy_name=None,
+            strategy_params={},
+            input_params={},
+            has_stop_loss=False,
+            has_take_profit=False,
+            stop_loss_method=None,
+            take_profit_method=None,
+            has_position_checks=False,
+            prevents_multiple_entries=False,
+        )
+        calls: set[str] = set()
+        for event in _tokenize(text):
+            handler = self._EVENT_HANDLERS.get(type(event))
+            if handler is not None:
+                handler(self, text, event, draft, calls)
+
+        # Cached results are shared, so expose the parsed parameters read-only
+        draft.strategy_params = MappingProxyType(draft.strategy_params)
+        draft.input_params = MappingProxyType(
+            {name: MappingProxyType(info) for name, info in draft.input_params.items()}
+        )
+
+        return ValidationResult(
+            is_valid=len(errors) == 0,
+            version=version,
+            errors=errors,
+            declarations=[name for name in ("strategy", "indicator") if name in calls],
+            functions_called=frozenset(calls),
+            has_entry_conditions="strategy.entry" in calls,
+            has_exit_conditions="strategy.exit" in calls or "strategy.close" in calls,
+            entry_methods=[m for m in ("ta.crossover", "ta.crossunder") if m in calls],
+            exit_methods=[m for m in ("ta.crossunder", "ta.crossover") if m in calls],
+            position_checks=["strategy.position_size"] if draft.has_position_checks else [],
+            **vars(draft),
+        )
+
+    def check_version(self, content: str | bytes) -> dict[str, Any]:
         """Check Pine Script version.
 
         Args:
-            content: Pine Script content
+            content: Pine Script content, as text or UTF-8 bytes
 
         Returns:
             Version check result
         """
-        version_pattern = r"//@version=(\d+)"
-        match = re.search(version_pattern, content)
+        if isinstance(content, bytes):
+            match = _VERSION_BYTES.search(content)
+        else:
+            match = _VERSION.search(content)
 
         if not match:
             return {"valid": False, "errors": ["Pine Script version declaration not found"]}
 
         version = match.group(1)
+        if isinstance(version, bytes):
+            version = version.decode()
 
         if version != self.required_version:
             return {
@@ -177,16 +480,17 @@ class PineScriptValidator:
 
         return {"valid": True, "version": version}
 
-    def validate_syntax(self, content: str) -> dict[str, Any]:
+    def validate_syntax(self, content: str | bytes) -> dict[str, Any]:
         """Validate Pine Script syntax.
 
         Args:
-            content: Pine Script content
+            content: Pine Script content, as text or UTF-8 bytes
 
         Returns:
             Syntax validation result
         """
         errors = []
+        content = _encode(content)
 
         # Check for basic syntax errors
         if not self._check_brackets(content):
@@ -219,16 +523,17 @@ class PineScriptValidator:
 
     def validate_against_template(self, content: str) -> Any:
         """Validate against strategy template."""
+        sections = self.validate_sections(content)
 
         # Simplified template validation
         class TemplateResult:
             def __init__(self) -> None:
-                self.has_version_declaration = "//@version=" in content
-                self.has_strategy_declaration = "strategy(" in content
-                self.has_input_section = "input." in content
-                self.has_calculation_section = "ta." in content or "rsi" in content
-                self.has_trading_logic = "strategy.entry" in content
-                self.has_visualization = "plot(" in content
+                self.has_version_declaration = sections["version_declaration"]
+                self.has_strategy_declaration = sections["strategy_declaration"]
+                self.has_input_section = sections["input_parameters"]
+                self.has_calculation_section = sections["indicator_calculations"]
+                self.has_trading_logic = sections["entry_conditions"]
+                self.has_visualization = sections["plotting"]
                 self.compliance_score = (
                     sum(
                         [
@@ -249,134 +554,90 @@ class PineScriptValidator:
     def validate_sections(self, content: str) -> dict[str, bool]:
         """Validate presence of required sections."""
         return {
-            "version_declaration": "//@version=" in content,
-            "strategy_declaration": "strategy(" in content,
-            "input_parameters": "input." in content,
-            "indicator_calculations": "ta." in content or "rsi" in content,
-            "entry_conditions": "strategy.entry" in content,
-            "exit_conditions": "strategy.exit" in content or "strategy.close" in content,
-            "plotting": "plot(" in content,
+            section: any(marker in content for marker in markers)
+            for section, markers in _SECTION_MARKERS.items()
         }
 
-    def _extract_declarations(self, content: str) -> list[str]:
-        """Extract Pine Script declarations."""
-        declarations = []
-        if "strategy(" in content:
-            declarations.append("strategy")
-        if "indicator(" in content:
-            declarations.append("indicator")
-        return declarations
-
-    def _extract_strategy_name(self, content: str) -> str | None:
-        """Extract strategy name."""
-        pattern = r'strategy\("([^"]+)"'
-        match = re.search(pattern, content)
-        return match.group(1) if match else None
-
-    def _extract_strategy_params(self, content: str) -> dict[str, Any]:
-        """Extract strategy parameters."""
-        params = {}
-
-        # Look for overlay parameter
-        if "overlay=true" in content:
-            params["overlay"] = True
-        elif "overlay=false" in content:
-            params["overlay"] = False
-
-        # Look for initial_capital
-        pattern = r"initial_capital=(\d+)"
-        match = re.search(pattern, content)
-        if match:
-            params["initial_capital"] = int(match.group(1))
-
-        # Look for commission
-        if "commission_type" in content:
-            params["commission_type"] = "present"
-        if "commission_value" in content:
-            params["commission_value"] = "present"
-
-        return params
-
-    def _extract_input_params(self, content: str) -> dict[str, dict[str, Any]]:
-        """Extract input parameters."""
-        params = {}
-
-        # Pattern for input.int
-        int_pattern = r'(\w+)\s*=\s*input\.int\((\d+),\s*title="([^"]+)"(?:,\s*minval=(\d+))?(?:,\s*maxval=(\d+))?'
-
-        for match in re.finditer(int_pattern, content):
-            param_name = match.group(1)
-            default_val = int(match.group(2))
-            title = match.group(3)
-            minval = int(match.group(4)) if match.group(4) else None
-            maxval = int(match.group(5)) if match.group(5) else None
-
-            params[param_name] = {
-                "type": "int",
-                "default": default_val,
-                "title": title,
-                "minval": minval,
-                "maxval": maxval,
-            }
-
-        return params
-
-    def _extract_entry_methods(self, content: str) -> list[str]:
-        """Extract entry methods."""
-        methods = []
-        if "ta.crossover" in content:
-            methods.append("ta.crossover")
-        if "ta.crossunder" in content:
-            methods.append("ta.crossunder")
-        return methods
-
-    def _extract_exit_methods(self, content: str) -> list[str]:
-        """Extract exit methods."""
-        methods = []
-        if "ta.crossunder" in content:
-            methods.append("ta.crossunder")
-        if "ta.crossover" in content:
-            methods.append("ta.crossover")
-        return methods
-
-    def _check_brackets(self, content: str) -> bool:
+    def _on_call(
+        self, content: str, event: CallEvent, draft: SimpleNamespace, calls: set[str]
+    ) -> None:
+        """Record a function call."""
+        first_call = event.name not in calls
+        calls.add(event.name)
+        kwargs = {key: content[start:end].strip() for key, (start, end) in event.kwargs.items()}
+
+        if "stop" in kwargs:
+            draft.has_stop_loss = True
+        if "limit" in kwargs:
+            draft.has_take_profit = True
+
+        if event.name == "strategy" and first_call:
+            if event.args:
+                first = content[slice(*event.args[0])].strip()
+                if first.startswith('"') and first.endswith('"'):
+                    draft.strategy_name = first[1:-1]
+
+            if kwargs.get("overlay") in ("true", "false"):
+                draft.strategy_params["overlay"] = kwargs["overlay"] == "true"
+            if kwargs.get("initial_capital", "").isdigit():
+                draft.strategy_params["initial_capital"] = int(kwargs["initial_capital"])
+            for key in ("commission_type", "commission_value"):
+                if key in kwargs:
+                    draft.strategy_params[key] = "present"
+
+        elif event.name == "input.int" and event.target is not None and event.args:
+            default = content[slice(*event.args[0])].strip()
+            if default.isdigit():
+                draft.input_params[event.target] = {
+                    "type": "int",
+                    "default": int(default),
+                    "title": kwargs.get("title", "").strip('"') or None,
+                    "minval": int(kwargs["minval"]) if kwargs.get("minval", "").isdigit() else None,
+                    "maxval": int(kwargs["maxval"]) if kwargs.get("maxval", "").isdigit() else None,
+                }
+
+    def _on_name(
+        self, content: str, event: NameEvent, draft: SimpleNamespace, calls: set[str]
+    ) -> None:
+        """Record an identifier reference."""
+        if "stop_loss" in event.name:
+            draft.has_stop_loss = True
+            if "stop_loss_pct" in event.name:
+                draft.stop_loss_method = "percentage"
+        elif "take_profit" in event.name:
+            draft.has_take_profit = True
+            if "take_profit_pct" in event.name:
+                draft.take_profit_method = "percentage"
+        elif event.name == "strategy.position_size":
+            draft.has_position_checks = True
+
+    def _on_compare(
+        self, content: str, event: CompareEvent, draft: SimpleNamespace, calls: set[str]
+    ) -> None:
+        """Record a comparison."""
+        if event.op == "==" and {event.left, event.right} == {"strategy.position_size", "0"}:
+            draft.prevents_multiple_entries = True
+
+    _EVENT_HANDLERS = {
+        CallEvent: _on_call,
+        NameEvent: _on_name,
+        CompareEvent: _on_compare,
+    }
+
+    def _check_brackets(self, content: str | bytes) -> bool:
         """Check bracket matching."""
-        stack = []
-        pairs = {"(": ")", "[": "]", "{": "}"}
+        return _brackets_balanced(_as_bytes(content))
 
-        for char in content:
-            if char in pairs:
-                stack.append(pairs[char])
-            elif char in pairs.values():
-                if not stack or stack.pop() != char:
-                    return False
-
-        return len(stack) == 0
-
-    def _check_commas(self, content: str) -> bool:
+    def _check_commas(self, content: str | bytes) -> bool:
         """Check comma placement in function calls."""
         # Simplified check - look for obvious missing commas
         # This is a basic implementation
-        return "title=" in content and ("," in content or content.count("=") == 1)
+        raw = _encode(content)
+        return b"title=" in raw and (b"," in raw or raw.count(b"=") == 1)
 
-    def _check_quotes(self, content: str) -> bool:
+    def _check_quotes(self, content: str | bytes) -> bool:
         """Check quote matching."""
-        in_quote = False
-        escape_next = False
-
-        for char in content:
-            if escape_next:
-                escape_next = False
-                continue
-
-            if char == "\\":
-                escape_next = True
-                continue
-
-            if char == '"':
-                in_quote = not in_quote
-
-        return not in_quote
+        return _quotes_balanced(_as_bytes(content))
 
 
 @dataclass
@@ -391,6 +652,12 @@ class RSIValidationResult:
     overbought_range: tuple = (60, 90)
 
 
+def _param_range(param_info: dict[str, Any], default: tuple) -> tuple:
+    """Return an input's (minval, maxval), falling back to the default bounds."""
+    low, high = param_info.get("minval"), param_info.get("maxval")
+    return (default[0] if low is None else low, default[1] if high is None else high)
+
+
 class IndicatorValidator:
     """Validates indicator usage in Pine Script."""
 
@@ -398,37 +665,35 @@ class IndicatorValidator:
         """Validate RSI indicator usage."""
         rsi_result = RSIValidationResult()
 
-        # Check for RSI calculation in content directly
-        content = getattr(validation_result, "_original_content", "")
-
-        # Check for RSI calculation
-        rsi_result.has_rsi_calculation = (
-            "ta.rsi" in content or "rsi_value" in content or "rsi(" in content
-        )
+        # Works on the parsed result only, so the source is never re-scanned
+        calls = validation_result.functions_called
+        rsi_result.has_rsi_calculation = "ta.rsi" in calls or "rsi" in calls
 
         # Check RSI parameters
         for param_name, param_info in validation_result.input_params.items():
-            if "rsi" in param_name.lower() and "period" in param_name.lower():
-                rsi_result.rsi_period_range = (
-                    param_info.get("minval", 5),
-                    param_info.get("maxval", 50),
-                )
-            elif "oversold" in param_name.lower():
+            name = param_name.lower()
+            if "rsi" in name and "period" in name:
+                rsi_result.rsi_period_range = _param_range(param_info, rsi_result.rsi_period_range)
+            elif "oversold" in name:
                 rsi_result.has_oversold_level = True
-                rsi_result.oversold_range = (
-                    param_info.get("minval", 10),
-                    param_info.get("maxval", 40),
-                )
-            elif "overbought" in param_name.lower():
+                rsi_result.oversold_range = _param_range(param_info, rsi_result.oversold_range)
+            elif "overbought" in name:
                 rsi_result.has_overbought_level = True
-                rsi_result.overbought_range = (
-                    param_info.get("minval", 60),
-                    param_info.get("maxval", 90),
-                )
+                rsi_result.overbought_range = _param_range(param_info, rsi_result.overbought_range)
 
         return rsi_result
 
 
+@dataclass(frozen=True)
+class ComplexityResult:
+    """Result of strategy complexity analysis."""
+
+    line_count: int
+    condition_count: int
+    variable_count: int
+    complexity_score: str
+
+
 class StrategyAnalyzer:
     """Analyzes trading strategies."""
 
@@ -447,8 +712,7 @@ class StrategyAnalyzer:
         params = {}
 
         # Extract input parameters with defaults
-        int_pattern = r"(\w+)\s*=\s*input\.int\((\d+)"
-        for match in re.finditer(int_pattern, content):
+        for match in _INPUT_INT.finditer(content):
             param_name = match.group(1)
             default_val = int(match.group(2))
             params[param_name] = {"default": default_val}
@@ -480,23 +744,18 @@ class StrategyAnalyzer:
 
         return BestPracticesResult()
 
-    def analyze_complexity(self, content: str) -> Any:
+    def analyze_complexity(self, content: str | bytes) -> ComplexityResult:
         """Analyze strategy complexity."""
+        line_count, condition_count, variable_count = _complexity_counts(content)
 
-        class ComplexityResult:
-            def __init__(self) -> None:
-                self.line_count = len(content.split("\n"))
-                self.condition_count = content.count("if ") + content.count("if(")
-                self.variable_count = content.count(" = ") + content.count("=")
-
-                if self.line_count < 50:
-                    self.complexity_score = "low"
-                elif self.line_count < 150:
-                    self.complexity_score = "medium"
-                else:
-                    self.complexity_score = "high"
+        if line_count < 50:
+            complexity_score = "low"
+        elif line_count < 150:
+            complexity_score = "medium"
+        else:
+            complexity_score = "high"
 
-        return ComplexityResult()
+        return ComplexityResult(line_count, condition_count, variable_count, complexity_score)
 
     def get_performance_hints(self, content: str) -> list[str]:
         """Get performance optimization hints."""
@@ -511,121 +770,361 @@ class StrategyAnalyzer:
         return hints
 
 
+@dataclass
+class ParsedScript:
+    """Structural view of a Pine Script produced by PineParser."""
+
+    version: str | None = None
+    strategy_declaration: str | None = None
+    input_declarations: list[str] = field(default_factory=list)
+    variable_declarations: list[str] = field(default_factory=list)
+    condition_blocks: list[str] = field(default_factory=list)
+    function_calls: list[str] = field(default_factory=list)
+
+
 class PineParser:
-    """Parses Pine Script structure."""
+    """Parses Pine Script structure.
 
-    def parse_script(self, content: str) -> Any:
-        """Parse Pine Script into AST-like structure."""
+    The script is parsed once into a ParsedScript and the extract_* methods
+    query that structure. The last parse is kept so repeated queries on the
+    same source do not re-scan it.
+    """
 
-        class ParseResult:
-            def __init__(self) -> None:
-                version_match = re.search(r"//@version=(\d+)", content)
-                self.version = version_match.group(1) if version_match else None
+    def __init__(self) -> None:
+        """Initialize parser."""
+        self._last_source: str | None = None
+        self._last_parse: ParsedScript | None = None
 
-                self.strategy_declaration = "strategy(" in content
+    def parse_script(self, content: str) -> ParsedScript:
+        """Parse Pine Script into AST-like structure.
 
-                # Count input declarations
-                self.input_declarations = content.count("input.")
+        Args:
+            content: Pine Script source code
 
-                # Count variable declarations
-                self.variable_declarations = content.count(" = ")
+        Returns:
+            Parsed script structure
+        """
+        if content == self._last_source and self._last_parse is not None:
+            return _unshared(self._last_parse)
+
+        parsed = ParsedScript()
+        calls: dict[str, int] = {}
+
+        for event in _tokenize(content):
+            if isinstance(event, VersionEvent):
+                parsed.version = parsed.version or event.version
+            elif isinstance(event, CallEvent):
+                if "." in event.name:
+                    calls[event.name] = min(calls.get(event.name, event.span[0]), event.span[0])
+                elif event.name == "strategy" and parsed.strategy_declaration is None:
+                    parsed.strategy_declaration = content[slice(*event.span)]
+            elif isinstance(event, AssignEvent):
+                parsed.variable_declarations.append(event.name)
+                if content[slice(*event.rhs_span)].lstrip().startswith("input"):
+                    parsed.input_declarations.append(event.name)
+            elif isinstance(event, IfEvent):
+                parsed.condition_blocks.append(content[slice(*event.cond_span)].strip())
+
+        parsed.function_calls = sorted(calls, key=calls.__getitem__)
+        self._last_source = content
+        self._last_parse = parsed
+        return _unshared(parsed)
+
+    def extract_functions(self, content: str) -> frozenset[str]:
+        """Extract namespaced function calls (e.g. ta.rsi).
+
+        Reuses the last parse of the same source, otherwise finds the calls
+        with a single regex scan instead of a full parse.
+        """
+        if content == self._last_source and self._last_parse is not None:
+            return frozenset(self._last_parse.function_calls)
 
-                # Count condition blocks
-                self.condition_blocks = content.count("if ")
+        calls = (m.group(1) for m in _DOTTED_CALL.finditer(_encode(content)))
+        return frozenset(call.decode() for call in calls if call)
 
-        return ParseResult()
+    def extract_variables(self, content: str) -> frozenset[str]:
+        """Extract variable declarations."""
+        return frozenset(self.parse_script(content).variable_declarations)
 
-    def extract_functions(self, content: str) -> list[str]:
-        """Extract function calls."""
-        functions = []
 
-        # Common Pine Script functions
-        pine_functions = [
-            "ta.rsi",
-            "ta.crossover",
-            "ta.crossunder",
-            "strategy.entry",
-            "strategy.close",
-            "strategy.exit",
-        ]
+class _ConfiguredValidator:
+    """Cache key for a validator: its class plus every instance attribute.
 
-        for func in pine_functions:
-            if func in content:
-                functions.append(func)
+    Two validators with the same configuration share cache entries, and the
+    first one seen runs the validation.
+    """
 
-        return functions
+    __slots__ = ("validator", "key")
 
-    def extract_variables(self, content: str) -> list[str]:
-        """Extract variable declarations."""
-        variables = []
+    def __init__(self, validator: PineScriptValidator) -> None:
+        self.validator = validator
+        self.key = (type(validator), tuple(sorted(vars(validator).items())))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ConfiguredValidator) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def run(self, content: str | bytes, full: bool) -> ValidationResult:
+        """Validate with the wrapped validator, bypassing the cache."""
+        if full:
+            return self.validator._validate(content)
+        return self.validator._validate_fast(content)
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_cached(
+    handle: _ConfiguredValidator, content: str | bytes, full: bool
+) -> ValidationResult:
+    """Validate a source once per (validator configuration, source, mode)."""
+    return handle.run(content, full)
+
+
+_Cached = TypeVar("_Cached", ValidationResult, ParsedScript)
+
+
+def _unshared(result: _Cached) -> _Cached:
+    """Copy a cached result's lists so callers cannot corrupt later cache hits."""
+    lists = {
+        f.name: list(value)
+        for f in dataclasses.fields(result)
+        if isinstance(value := getattr(result, f.name), list)
+    }
+    return dataclasses.replace(result, **lists)
+
+
+# Byte codes used by the vectorized syntax scans
+_OPEN_KIND = np.zeros(256, dtype=np.int8)
+_OPEN_KIND[[ord("("), ord("["), ord("{")]] = [1, 2, 3]
+_CLOSE_KIND = np.zeros(256, dtype=np.int8)
+_CLOSE_KIND[[ord(")"), ord("]"), ord("}")]] = [1, 2, 3]
+_WORD_BYTE = np.zeros(256, dtype=bool)
+_WORD_BYTE[[ord(c) for c in "0123456789_"]] = True
+_WORD_BYTE[ord("A") : ord("Z") + 1] = True
+_WORD_BYTE[ord("a") : ord("z") + 1] = True
+_WORD_BYTE[128:] = True  # UTF-8 bytes of non-ASCII identifiers
+
+
+def _encode(content: str | bytes) -> bytes:
+    """Return the source as UTF-8 bytes, passing bytes through unchanged."""
+    return content if isinstance(content, bytes) else content.encode()
+
+
+def _as_text(content: str | bytes) -> str:
+    """Return the source as text, decoding UTF-8 bytes."""
+    return content.decode() if isinstance(content, bytes) else content
+
+
+def _as_bytes(content: str | bytes) -> np.ndarray:
+    """View the UTF-8 encoded source as a uint8 array (bytes are not copied)."""
+    return np.frombuffer(_encode(content), dtype=np.uint8)
+
+
+@njit(cache=True)
+def _scan_brackets(buf: np.ndarray) -> tuple[bool, int]:
+    """Match (), [] and {} in one pass over the source bytes.
+
+    Returns:
+        Tuple of (balanced, offset of the first offending bracket or -1)
+    """
+    openers = np.empty(buf.size, dtype=np.int64)
+    top = 0
+    for i in range(buf.size):
+        c = buf[i]
+        if c == 40 or c == 91 or c == 123:  # ( [ {
+            openers[top] = i
+            top += 1
+        elif c == 41 or c == 93 or c == 125:  # ) ] }
+            if top == 0:
+                return False, i
+            opener = buf[openers[top - 1]]
+            if (
+                (c == 41 and opener != 40)
+                or (c == 93 and opener != 91)
+                or (c == 125 and opener != 123)
+            ):
+                return False, i
+            top -= 1
+    if top > 0:
+        return False, openers[0]
+    return True, -1
+
+
+@njit(cache=True)
+def _scan_quotes(buf: np.ndarray) -> tuple[bool, int]:
+    """Track double quote strings and backslash escapes in one pass.
+
+    Returns:
+        Tuple of (closed, offset of the unterminated opening quote or -1)
+    """
+    start = -1
+    escaped = False
+    for i in range(buf.size):
+        c = buf[i]
+        if escaped:
+            escaped = False
+        elif c == 92:  # backslash
+            escaped = True
+        elif c == 34:  # double quote
+            start = i if start < 0 else -1
+    return start < 0, start
+
+
+@njit(cache=True)
+def _count_complexity(buf: np.ndarray) -> tuple[int, int, int]:
+    """Count lines, conditions and assignments in one pass.
+
+    Matches ``str.count`` semantics: conditions are ``if `` and ``if(``,
+    and every ``=`` counts once plus once more when it is part of a
+    non-overlapping `` = ``.
+
+    Returns:
+        Tuple of (line_count, condition_count, variable_count)
+    """
+    n = buf.size
+    lines = 1
+    conds = 0
+    assigns = 0
+    spaced_end = 0  # end of the last counted " = ", so matches never overlap
+    for i in range(n):
+        c = buf[i]
+        if c == 10:  # newline
+            lines += 1
+        elif c == 61:  # =
+            assigns += 1
+            if (
+                i >= 1
+                and i + 1 < n
+                and buf[i - 1] == 32
+                and buf[i + 1] == 32
+                and i - 1 >= spaced_end
+            ):
+                assigns += 1
+                spaced_end = i + 2
+        elif c == 105 and i + 2 < n and buf[i + 1] == 102:  # "if"
+            nxt = buf[i + 2]
+            if nxt == 32 or nxt == 40:  # space or (
+                conds += 1
+    return lines, conds, assigns
+
+
+def _complexity_counts(content: str | bytes) -> tuple[int, int, int]:
+    """Count lines, conditions and assignments for analyze_complexity."""
+    if NUMBA_AVAILABLE:
+        lines, conds, assigns = _count_complexity(_as_bytes(content))
+        return int(lines), int(conds), int(assigns)
+
+    text = _as_text(content)
+    return (
+        text.count("\n") + 1,
+        text.count("if ") + text.count("if("),
+        text.count(" = ") + text.count("="),
+    )
+
+
+def _brackets_balanced(buf: np.ndarray) -> bool:
+    """Check that (), [] and {} are balanced and properly nested."""
+    if NUMBA_AVAILABLE:
+        return bool(_scan_brackets(buf)[0])
+
+    open_kind = _OPEN_KIND[buf]
+    close_kind = _CLOSE_KIND[buf]
+    pos = np.flatnonzero(open_kind | close_kind)
+    if pos.size == 0:
+        return True
+
+    step = np.where(open_kind[pos] > 0, 1, -1)
+    depth = np.cumsum(step)
+    if depth.min() < 0 or depth[-1] != 0:
+        return False
+
+    # At each nesting level openers and closers alternate in source order,
+    # so after a stable sort by level they pair up as (0, 1), (2, 3), ...
+    level = np.where(step > 0, depth, depth + 1)
+    order = np.argsort(level, kind="stable")
+    kind = (open_kind | close_kind)[pos][order]
+    return bool(np.all(kind[0::2] == kind[1::2]))
+
+
+def _string_masks(buf: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Locate unescaped double quotes and the bytes outside string literals.
+
+    Returns:
+        Tuple of (quote mask, outside-string mask)
+    """
+    backslash = buf == ord("\\")
+    runs = np.cumsum(backslash)
+    run_start = np.maximum.accumulate(np.where(backslash, 0, runs))
+    # A byte is escaped when preceded by an odd run of backslashes
+    escaped = np.zeros(buf.size, dtype=bool)
+    escaped[1:] = ((runs - run_start)[:-1] & 1).astype(bool)
+
+    quote = (buf == ord('"')) & ~escaped
+    inside = (np.cumsum(quote) & 1).astype(bool)
+    return quote, ~inside & ~quote
+
+
+def _quotes_balanced(buf: np.ndarray) -> bool:
+    """Check that every double quote string is closed."""
+    if NUMBA_AVAILABLE:
+        return bool(_scan_quotes(buf)[0])
 
-        # Pattern for variable assignments
-        pattern = r"(\w+)\s*="
-        matches = re.findall(pattern, content)
+    quote, _ = _string_masks(buf)
+    return int(np.count_nonzero(quote)) % 2 == 0
 
-        # Filter out function calls and keywords
-        keywords = {"if", "for", "while", "strategy", "input", "plot"}
-        variables = [var for var in matches if var not in keywords]
 
-        return variables
+def _commas_present(buf: np.ndarray) -> bool:
+    """Check that calls passing several keyword arguments separate them with commas."""
+    opens = np.flatnonzero(buf == ord("("))
+    opens = opens[(opens > 0) & _WORD_BYTE[buf[opens - 1]]]
+    closes = np.flatnonzero(buf == ord(")"))
+    if opens.size == 0 or closes.size == 0:
+        return True
+
+    # Calls are the non-overlapping matches of the regex \w+\([^)]+\): each
+    # spans from its "(" to the next ")", which must not follow directly
+    nxt = np.searchsorted(closes, opens)
+    found = nxt < closes.size
+    opens, ends = opens[found], closes[nxt[found]]
+    non_empty = ends > opens + 1
+    opens, ends = opens[non_empty], ends[non_empty]
+
+    # A call opened inside an earlier match shares its ")" and is part of it
+    first = np.diff(ends, prepend=-1) != 0
+    opens, ends = opens[first], ends[first]
+
+    # Unlike the regex, "=" and "," inside string literals are not counted
+    _, outside = _string_masks(buf)
+    equals = np.concatenate(([0], np.cumsum((buf == ord("=")) & outside)))
+    commas = np.concatenate(([0], np.cumsum((buf == ord(",")) & outside)))
+    missing = (equals[ends] - equals[opens] > 1) & (commas[ends] == commas[opens])
+    return not bool(np.any(missing))
 
 
 class SyntaxChecker:
-    """Checks Pine Script syntax."""
+    """Checks Pine Script syntax.
+
+    Each check runs as a few vectorized numpy passes over the UTF-8 bytes of
+    the script rather than a Python loop per character.
+    """
 
     def check_syntax(self, content: str) -> bool:
         """Check overall syntax."""
-        return (
-            self.check_brackets(content)
-            and self.check_commas(content)
-            and self.check_quotes(content)
-        )
+        buf = _as_bytes(content)
+        return _brackets_balanced(buf) and _commas_present(buf) and _quotes_balanced(buf)
 
     def check_brackets(self, content: str) -> bool:
         """Check bracket matching."""
-        stack = []
-        pairs = {"(": ")", "[": "]", "{": "}"}
-
-        for char in content:
-            if char in pairs:
-                stack.append(pairs[char])
-            elif char in pairs.values():
-                if not stack or stack.pop() != char:
-                    return False
-
-        return len(stack) == 0
+        return _brackets_balanced(_as_bytes(content))
 
     def check_commas(self, content: str) -> bool:
         """Check comma placement."""
-        # Look for function calls without proper commas
-        # This is a simplified check
-        function_calls = re.findall(r"\w+\([^)]+\)", content)
-
-        for call in function_calls:
-            # If there are multiple parameters, there should be commas
-            if "=" in call and call.count("=") > 1 and "," not in call:
-                return False
-
-        return True
+        return _commas_present(_as_bytes(content))
 
     def check_quotes(self, content: str) -> bool:
         """Check string quote matching."""
-        in_quote = False
-        escape_next = False
-
-        for char in content:
-            if escape_next:
-                escape_next = False
-                continue
-
-            if char == "\\":
-                escape_next = True
-                continue
-
-            if char == '"':
-                in_quote = not in_quote
-
-        return not in_quote
+        return _quotes_balanced(_as_bytes(content))
 
 
 # CLI validation functions
@@ -640,7 +1139,7 @@ class TemplateValidator:
             def __init__(self) -> None:
                 try:
                     validator = PineScriptValidator()
-                    result = validator.validate_file(Path(file_path))
+                    result = validator.validate_file(Path(file_path), full=False)
 
                     if result.is_valid:
                         self.exit_code = 0
@@ -670,7 +1169,7 @@ class RSIValidator:
             def __init__(self) -> None:
                 try:
                     validator = PineScriptValidator()
-                    result = validator.validate_file(Path(file_path))
+                    result = validator.validate_file(Path(file_path), full=False)
 
                     if result.is_valid:
                         self.exit_code = 0
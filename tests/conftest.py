@@ -0,0 +1,87 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register custom command line options."""
+    parser.addoption(
+        "--strict-compare",
+        action="store_true",
+        default=False,
+        help="Also compare round-tripped frames with pandas.testing.assert_frame_equal",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _pyarrow_warmup() -> None:
+    """Pay the one-time pyarrow/snappy initialization cost before any test runs."""
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.table({"x": [1]}), sink, compression="snappy")
+    pd.read_parquet(pa.BufferReader(sink.getvalue()))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _numba_warmup() -> None:
+    """Compile (or load from cache) every jitted kernel before any test runs.
+
+    Goes through the public entry points, so the kernels see the same
+    argument types as in the tests and none is recompiled later. Modules
+    that fail to import are left to their own importorskip guards.
+    """
+    from src.jit import NUMBA_AVAILABLE
+
+    if not NUMBA_AVAILABLE:
+        return
+
+    try:
+        from src.strategies.validator import StrategyAnalyzer, SyntaxChecker
+    except ImportError:
+        pass
+    else:
+        SyntaxChecker().check_syntax('f("x")')
+        StrategyAnalyzer().analyze_complexity("if x\n")
+
+    try:
+        from src.backtest.engine import BacktestEngine, RSIStrategy
+    except ImportError:
+        pass
+    else:
+        close = np.linspace(100.0, 110.0, 5)
+        bars = pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2024-01-01", periods=len(close), freq="D"),
+                "close": close,
+            }
+        )
+        BacktestEngine(RSIStrategy(rsi_period=2), Decimal("10000")).run_backtest(bars, "WARMUP")
+
+
+@pytest.fixture(scope="module")
+def sample_ohlcv_df() -> pd.DataFrame:
+    """Three daily OHLCV bars shared by every test in a module.
+
+    The frame is built once per module, so tests that need to mutate it
+    must work on ``sample_ohlcv_df.copy()``.
+    """
+    return pd.DataFrame(
+        {
+            # Second-resolution timestamps, like exchange epochs
+            "timestamp": np.array(
+                ["2024-01-01", "2024-01-02", "2024-01-03"], dtype="datetime64[s]"
+            ),
+            "open": [47000.0, 47500.0, 48000.0],
+            "high": [48000.0, 48500.0, 49000.0],
+            "low": [46500.0, 47000.0, 47800.0],
+            "close": [47500.0, 48000.0, 48500.0],
+            "volume": [1.5, 2.1, 1.8],
+        }
+    )
@@ -0,0 +1,54 @@
+"""
+Generate the OHLCV Parquet fixtures used by the backtest tests.
+
+Run once after changing the fixture recipe and commit the output:
+
+    python tests/fixtures/gen.py
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+FIXTURES_DIR = Path(__file__).parent
+
+
+def build_ohlcv(periods: int, seed: int = 42) -> pa.Table:
+    """Build a deterministic daily OHLCV random walk.
+
+    Args:
+        periods: Number of daily bars
+        seed: Random seed
+
+    Returns:
+        OHLCV Arrow table starting 2024-01-01
+    """
+    dates = pd.date_range("2024-01-01", periods=periods, freq="D")
+    np.random.seed(seed)
+    prices = 47000 + np.cumsum(np.random.normal(0, 100, periods))
+
+    return pa.table(
+        {
+            "timestamp": pa.array(dates),
+            "open": prices * 0.999,
+            "high": prices * 1.002,
+            "low": prices * 0.998,
+            "close": prices,
+            "volume": np.random.uniform(1.0, 5.0, periods),
+        }
+    )
+
+
+def main() -> None:
+    """Write the 100- and 50-row fixtures."""
+    for periods in (100, 50):
+        path = FIXTURES_DIR / f"sample_ohlcv_{periods}.parquet"
+        pq.write_table(build_ohlcv(periods), path, compression=None)
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
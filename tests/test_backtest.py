@@ -7,21 +7,34 @@ This is strict TDD approach required by Constitution.
 Tests the backtesting engine functionality for RSI strategy execution.
 """
 
+import dataclasses
 from datetime import datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
 # These imports WILL FAIL initially - this is expected in TDD
-try:
-    from src.backtest.engine import BacktestEngine, Portfolio, RSIStrategy, Trade
-    from src.backtest.metrics import PerformanceMetrics, TradeAnalyzer
-    from src.backtest.models import BacktestResult
-except ImportError as e:
-    # Expected in TDD - tests written before implementation
-    pytest.skip(f"Implementation not yet available: {e}", allow_module_level=True)
+_engine = pytest.importorskip("src.backtest.engine", reason="Implementation not yet available")
+_metrics = pytest.importorskip("src.backtest.metrics", reason="Implementation not yet available")
+_models = pytest.importorskip("src.backtest.models", reason="Implementation not yet available")
+
+BacktestEngine, Portfolio = _engine.BacktestEngine, _engine.Portfolio
+RSIStrategy, Trade = _engine.RSIStrategy, _engine.Trade
+PerformanceMetrics, TradeAnalyzer = _metrics.PerformanceMetrics, _metrics.TradeAnalyzer
+BacktestResult = _models.BacktestResult
+
+# Pre-generated OHLCV fixtures (see tests/fixtures/gen.py)
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _load_ohlcv_fixture(periods: int) -> pd.DataFrame:
+    """Memory-map a committed OHLCV Parquet fixture into a DataFrame"""
+    path = FIXTURES_DIR / f"sample_ohlcv_{periods}.parquet"
+    return pq.read_table(path, memory_map=True).to_pandas()
 
 
 @pytest.fixture
@@ -135,6 +148,35 @@ class TestPortfolio:
         assert portfolio.positions_value == Decimal("0.0")
         assert len(portfolio.open_positions) == 0
 
+    def test_trade_times_stored_as_epoch_ns(self) -> None:
+        """Test trade timestamps are kept as int64 nanoseconds internally"""
+        portfolio = Portfolio(initial_capital=Decimal("10000.0"))
+        entry = datetime(2024, 1, 1, 9, 30)
+
+        trade = portfolio.buy("BTC/USDT", Decimal("47000.0"), Decimal("0.1"), entry)
+        portfolio.sell(trade.id, Decimal("48000.0"), entry + timedelta(hours=36))
+
+        assert trade.entry_ns == pd.Timestamp(entry).value
+        assert trade.exit_ns - trade.entry_ns == 36 * 3600 * 10**9
+        assert trade.entry_time == entry
+        assert trade.duration == timedelta(hours=36)
+        with pytest.raises(AttributeError):
+            trade.duration = timedelta(hours=1)
+
+    def test_trade_times_keep_time_zone(self) -> None:
+        """Test tz-aware trade timestamps round-trip with their time zone"""
+        portfolio = Portfolio(initial_capital=Decimal("10000.0"))
+        entry = pd.Timestamp("2024-01-01 09:30", tz="Asia/Seoul")
+
+        trade = portfolio.buy("BTC/USDT", Decimal("47000.0"), Decimal("0.1"), entry)
+        portfolio.sell(trade.id, Decimal("48000.0"), entry.tz_convert("UTC") + timedelta(hours=2))
+
+        assert trade.entry_time == entry
+        assert str(trade.entry_time.tz) == "Asia/Seoul"
+        assert str(trade.exit_time.tz) == "UTC"
+        assert trade.entry_ns == entry.value
+        assert trade.duration == timedelta(hours=2)
+
     def test_portfolio_commission_handling(self) -> None:
         """Test commission fees are properly deducted"""
         # This WILL FAIL - commission handling doesn't exist
@@ -191,22 +233,7 @@ class TestRSIStrategy:
     @pytest.fixture
     def sample_price_data(self) -> None:
         """Sample price data with RSI calculations"""
-        dates = pd.date_range("2024-01-01", periods=100, freq="D")
-        np.random.seed(42)  # For reproducible test data
-
-        # Generate price data with some trends
-        prices = 47000 + np.cumsum(np.random.normal(0, 100, 100))
-
-        return pd.DataFrame(
-            {
-                "timestamp": dates,
-                "open": prices * 0.999,
-                "high": prices * 1.002,
-                "low": prices * 0.998,
-                "close": prices,
-                "volume": np.random.uniform(1.0, 5.0, 100),
-            }
-        )
+        return _load_ohlcv_fixture(100)
 
     def test_rsi_strategy_initialization(self) -> None:
         """Test RSI strategy can be initialized with parameters"""
@@ -301,6 +328,20 @@ class TestRSIStrategy:
         expected_tp = entry_price * Decimal("1.04")  # 4% above entry
         assert take_profit == expected_tp
 
+    def test_risk_levels_follow_updated_percentages(self) -> None:
+        """Test cached stop loss / take profit multipliers track parameter updates"""
+        strategy = RSIStrategy(stop_loss_pct=0.02, take_profit_pct=0.04)
+        strategy.stop_loss_pct = 0.05
+        strategy.take_profit_pct = 0.1
+
+        entry_price = Decimal("47000.0")
+
+        assert strategy.calculate_stop_loss(entry_price) == entry_price * Decimal("0.95")
+        assert strategy.calculate_take_profit(entry_price) == entry_price * Decimal("1.1")
+        assert strategy.calculate_stop_loss(entry_price, side="short") == entry_price * Decimal(
+            "1.05"
+        )
+
 
 class TestBacktestEngine:
     """Test main backtesting engine functionality"""
@@ -313,20 +354,7 @@ class TestBacktestEngine:
     @pytest.fixture
     def sample_market_data(self) -> None:
         """Sample market data for backtesting"""
-        dates = pd.date_range("2024-01-01", periods=50, freq="D")
-        np.random.seed(42)
-        prices = 47000 + np.cumsum(np.random.normal(0, 100, 50))
-
-        return pd.DataFrame(
-            {
-                "timestamp": dates,
-                "open": prices * 0.999,
-                "high": prices * 1.002,
-                "low": prices * 0.998,
-                "close": prices,
-                "volume": np.random.uniform(1.0, 5.0, 50),
-            }
-        )
+        return _load_ohlcv_fixture(50)
 
     def test_backtest_engine_initialization(self, sample_strategy) -> None:
         """Test backtest engine initialization"""
@@ -360,6 +388,95 @@ class TestBacktestEngine:
         assert hasattr(result, "total_trades")
         assert hasattr(result, "win_rate")
 
+    def test_equity_curve_tracks_realised_pnl(self, sample_strategy) -> None:
+        """Test per-bar equity curve is exposed on the backtest result"""
+        # Steady decline drives RSI oversold, then a rally closes the position
+        close = np.concatenate([47000 - 100 * np.arange(20), 45100 + 500 * np.arange(1, 11)])
+        market_data = pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2024-01-01", periods=len(close), freq="D"),
+                "open": close,
+                "high": close * 1.002,
+                "low": close * 0.998,
+                "close": close,
+                "volume": np.ones(len(close)),
+            }
+        )
+        engine = BacktestEngine(strategy=sample_strategy, initial_capital=Decimal("10000.0"))
+
+        result = engine.run_backtest(market_data=market_data, symbol="BTC/USDT")
+
+        realised_pnl = sum(float(t.pnl) for t in engine.portfolio.closed_trades)
+        assert realised_pnl != 0
+        assert isinstance(result.equity_curve, np.ndarray)
+        assert len(result.equity_curve) == len(market_data)
+        assert result.equity_curve[0] == 10000.0
+        assert result.equity_curve[-1] == pytest.approx(10000.0 + realised_pnl)
+
+    def test_results_with_equity_curves_compare(self) -> None:
+        """Test results carrying equity curves compare on their metrics alone"""
+        fields = {"id": "r1", "strategy_id": "RSIStrategy", "symbol": "BTC/USDT"}
+        first = BacktestResult(
+            **fields, initial_capital=Decimal("10000"), equity_curve=np.array([10000.0, 10100.0])
+        )
+        second = BacktestResult(
+            **fields, initial_capital=Decimal("10000"), equity_curve=np.array([10000.0, 9900.0])
+        )
+
+        assert first == second
+        assert first != BacktestResult(
+            **{**fields, "id": "r2"}, initial_capital=Decimal("10000"), equity_curve=np.ones(2)
+        )
+
+    @pytest.mark.parametrize("seed", range(24))
+    def test_fused_kernel_matches_engine(self, seed) -> None:
+        """Test the fused RSI fast path trades exactly like the per-bar reference loop"""
+        # Small integer steps with flat runs: RSI lands on its thresholds and
+        # prices land on stop loss / take profit levels
+        rng = np.random.default_rng(seed)
+        steps = rng.integers(-3, 4, 250) * (rng.random(250) < 0.7)
+        close = np.maximum(1, 100 + np.cumsum(steps)).astype(float)
+        market_data = pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2024-01-01", periods=len(close), freq="D"),
+                "open": close,
+                "high": close,
+                "low": close,
+                "close": close,
+                "volume": np.ones(len(close)),
+            }
+        )
+        strategy = RSIStrategy(
+            rsi_period=11 if seed % 4 == 0 else int(rng.integers(2, 21)),
+            oversold_threshold=25 if seed % 4 == 0 else int(rng.integers(15, 41)),
+            overbought_threshold=int(rng.integers(60, 86)),
+            stop_loss_pct=float(rng.choice([0.01, 0.02, 0.05])),
+            take_profit_pct=float(rng.choice([0.02, 0.04, 0.1])),
+        )
+        reference = BacktestEngine(
+            strategy=strategy, initial_capital=Decimal("10000.0"), use_fast_path=False
+        )
+        engine = BacktestEngine(strategy=strategy, initial_capital=Decimal("10000.0"))
+
+        expected = reference.run_backtest(market_data=market_data, symbol="BTC/USDT")
+        result = engine.run_backtest(market_data=market_data, symbol="BTC/USDT")
+
+        def trade_rows(trades):
+            return [
+                (t.entry_ns, t.exit_ns, t.quantity, t.exit_price, t.pnl, t.exit_reason)
+                for t in trades
+            ]
+
+        assert trade_rows(engine.portfolio.closed_trades) == trade_rows(
+            reference.portfolio.closed_trades
+        )
+        assert trade_rows(engine.portfolio.open_positions) == trade_rows(
+            reference.portfolio.open_positions
+        )
+        assert engine.portfolio.cash == reference.portfolio.cash
+        assert dataclasses.replace(result, id=expected.id) == expected
+        np.testing.assert_array_equal(result.equity_curve, expected.equity_curve)
+
     def test_signal_processing(self, sample_strategy, sample_market_data) -> None:
         """Test signal processing and trade execution"""
         # This WILL FAIL - signal processing doesn't exist
@@ -532,6 +649,13 @@ class TestPerformanceMetrics:
         assert profit_factor == expected_pf
         assert profit_factor == 5.0  # 250 / 50
 
+    def test_trade_metrics_use_cached_frame(self, sample_trades) -> None:
+        """Test trade metrics default to the trades passed at construction"""
+        metrics = PerformanceMetrics(initial_capital=Decimal("10000.0"), trades=sample_trades)
+
+        assert metrics.calculate_win_rate() == pytest.approx(2 / 3)
+        assert metrics.calculate_profit_factor() == 5.0
+
 
 class TestTradeAnalyzer:
     """Test trade analysis functionality"""
@@ -550,11 +674,10 @@ class TestTradeAnalyzer:
         # This WILL FAIL - duration analysis doesn't exist
         analyzer = TradeAnalyzer()
 
-        # Add duration to trades
+        # Give every trade a two-day holding period; duration derives from the times
         for i, trade in enumerate(sample_trades):
             trade.entry_time = datetime(2024, 1, 1) + timedelta(days=i * 3)
             trade.exit_time = trade.entry_time + timedelta(days=2)
-            trade.duration = trade.exit_time - trade.entry_time
 
         avg_duration = analyzer.calculate_average_duration(sample_trades)
 
@@ -8,123 +8,170 @@ Tests complete end-to-end workflow from data download to backtest results.
 """
 
 import argparse
+import copy
+import dataclasses
+import io
+import sys
+from decimal import Decimal
 from pathlib import Path
+from types import SimpleNamespace
+from typing import ClassVar, Final
 from unittest.mock import Mock, patch
 
-import pandas as pd
 import pytest
 
-# These imports WILL FAIL initially - this is expected in TDD
-try:
-    from src.backtest.engine import BacktestEngine  # noqa: F401
+# These imports WILL FAIL initially - this is expected in TDD.
+# src.main defers its engine/data/validator imports, so only the light CLI
+# module is loaded at collection time.
+pytest.importorskip("src.main", reason="Implementation not yet available")
+
+from src.backtest.models import BacktestResult  # noqa: E402
+from src.main import (  # noqa: E402
+    BacktestCLI,
+    full_workflow,
+    main,
+    parse_arguments,
+    quickstart_workflow,
+)
+
+# Successful backtest shared by engine mocks; use dataclasses.replace to vary it
+_SUCCESS_RESULT: Final[BacktestResult] = BacktestResult(
+    id="test_backtest",
+    strategy_id="rsi_basic",
+    symbol="BTCUSDT",
+    initial_capital=Decimal("10000"),
+    final_capital=Decimal("11250"),
+    total_trades=8,
+    win_rate=0.65,
+    max_drawdown=-0.082,
+)
+
+# Basic RSI strategy used by the Pine Script validation scenario
+_RSI_BASIC_PINE: Final[str] = """
+//@version=6
+strategy("RSI Basic", overlay=true, initial_capital=10000)
+rsi = ta.rsi(close, 14)
+if ta.crossover(rsi, 30)
+    strategy.entry("Long", strategy.long)
+if ta.crossunder(rsi, 70)
+    strategy.close("Long")
+"""
 
-    # from src.backtest.models import BacktestResult  # Only needed for non-skipped tests
-    from src.data.ccxt_client import DataDownloader  # noqa: F401
-    from src.main import BacktestCLI, full_workflow, main, parse_arguments, quickstart_workflow
-    from src.strategies.validator import PineScriptValidator  # noqa: F401
-except ImportError as e:
-    # Expected in TDD - tests written before implementation
-    pytest.skip(f"Implementation not yet available: {e}", allow_module_level=True)
 
+@pytest.fixture(scope="session")
+def mock_data_file(tmp_path_factory):
+    """Mock data file path for testing (backtests are mocked, so it stays empty)"""
+    data_file = tmp_path_factory.mktemp("data") / "BTCUSDT_1d_100.parquet"
+    data_file.touch()
+    return data_file
 
-class TestCLIArgumentParsing:
-    """Test command-line argument parsing"""
 
-    def test_parse_backtest_arguments(self) -> None:
-        """Test parsing backtest command arguments"""
-        # This WILL FAIL - argument parsing doesn't exist
-        args = parse_arguments(["backtest", "--symbol", "BTCUSDT"])
-
-        assert args.command == "backtest"
-        assert args.symbol == "BTCUSDT"
-        assert hasattr(args, "timeframe")
-        assert hasattr(args, "initial_capital")
-        assert hasattr(args, "commission_rate")
-
-    def test_parse_backtest_with_options(self) -> None:
-        """Test parsing backtest with all options"""
-        # This WILL FAIL - full argument parsing doesn't exist
-        args = parse_arguments(
-            [
-                "backtest",
-                "--symbol",
-                "ETHUSDT",
-                "--timeframe",
-                "4h",
-                "--initial-capital",
-                "50000",
-                "--commission-rate",
-                "0.001",
-                "--data-dir",
-                "custom_data/",
-                "--output-dir",
-                "results/",
-            ]
-        )
+def _engine_mock(**overrides) -> Mock:
+    """Build a BacktestEngine mock whose run_backtest returns _SUCCESS_RESULT with overrides"""
+    engine = Mock()
+    engine.run_backtest.return_value = (
+        dataclasses.replace(_SUCCESS_RESULT, **overrides) if overrides else _SUCCESS_RESULT
+    )
+    return engine
 
-        assert args.symbol == "ETHUSDT"
-        assert args.timeframe == "4h"
-        assert args.initial_capital == 50000
-        assert args.commission_rate == 0.001
-        assert args.data_dir == "custom_data/"
-        assert args.output_dir == "results/"
-
-    def test_parse_download_arguments(self) -> None:
-        """Test parsing data download command arguments"""
-        # This WILL FAIL - download command parsing doesn't exist
-        args = parse_arguments(
-            ["download", "--symbol", "BTCUSDT", "--timeframe", "1d", "--limit", "365"]
-        )
 
-        assert args.command == "download"
-        assert args.symbol == "BTCUSDT"
-        assert args.timeframe == "1d"
-        assert args.limit == 365
+@pytest.fixture
+def mocks(monkeypatch):
+    """Route downloader, engine and validator construction to shared mocks"""
+    dl, eng, val = Mock(), _engine_mock(), Mock()
+    monkeypatch.setattr("src.data.ccxt_client.DataDownloader", lambda *a, **k: dl)
+    monkeypatch.setattr("src.backtest.engine.BacktestEngine", lambda *a, **k: eng)
+    monkeypatch.setattr("src.strategies.validator.PineScriptValidator", lambda *a, **k: val)
+    return SimpleNamespace(dl=dl, eng=eng, val=val)
 
-    def test_parse_validate_arguments(self) -> None:
-        """Test parsing Pine Script validation arguments"""
-        # This WILL FAIL - validate command parsing doesn't exist
-        args = parse_arguments(["validate", "--file", "src/strategies/rsi_basic.pine"])
 
-        assert args.command == "validate"
-        assert args.file == "src/strategies/rsi_basic.pine"
+class TestCLIArgumentParsing:
+    """Test command-line argument parsing"""
 
-    def test_invalid_command_handling(self) -> None:
-        """Test handling of invalid commands"""
+    _ARGV_BACKTEST_FULL: ClassVar[tuple[str, ...]] = (
+        "backtest",
+        "--symbol",
+        "ETHUSDT",
+        "--timeframe",
+        "4h",
+        "--initial-capital",
+        "50000",
+        "--commission-rate",
+        "0.001",
+        "--data-dir",
+        "custom_data/",
+        "--output-dir",
+        "results/",
+    )
+
+    @pytest.mark.parametrize(
+        "argv,expected",
+        [
+            # Backtest command with defaults
+            (
+                ("backtest", "--symbol", "BTCUSDT"),
+                {
+                    "command": "backtest",
+                    "symbol": "BTCUSDT",
+                    "timeframe": "1d",
+                    "initial_capital": 10000,
+                    "commission_rate": 0.001,
+                },
+            ),
+            # Backtest with all options
+            (
+                _ARGV_BACKTEST_FULL,
+                {
+                    "symbol": "ETHUSDT",
+                    "timeframe": "4h",
+                    "initial_capital": 50000,
+                    "commission_rate": 0.001,
+                    "data_dir": "custom_data/",
+                    "output_dir": "results/",
+                },
+            ),
+            # Data download command
+            (
+                ("download", "--symbol", "BTCUSDT", "--timeframe", "1d", "--limit", "365"),
+                {"command": "download", "symbol": "BTCUSDT", "timeframe": "1d", "limit": 365},
+            ),
+            # Pine Script validation command
+            (
+                ("validate", "--file", "src/strategies/rsi_basic.pine"),
+                {"command": "validate", "file": "src/strategies/rsi_basic.pine"},
+            ),
+        ],
+    )
+    def test_parse_arguments(self, argv, expected) -> None:
+        """Test parsing command arguments"""
+        # This WILL FAIL - argument parsing doesn't exist
+        args = parse_arguments(list(argv))
+
+        assert expected.items() <= vars(args).items()
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ("invalid_command",),  # Invalid command
+            ("backtest",),  # Missing --symbol
+        ],
+    )
+    def test_invalid_arguments(self, argv, monkeypatch) -> None:
+        """Test handling of invalid commands and missing required arguments"""
         # This WILL FAIL - error handling doesn't exist
-        with pytest.raises(SystemExit):
-            parse_arguments(["invalid_command"])
+        stderr = io.StringIO()
+        monkeypatch.setattr(sys, "stderr", stderr)
 
-    def test_missing_required_arguments(self) -> None:
-        """Test handling of missing required arguments"""
-        # This WILL FAIL - validation doesn't exist
-        with pytest.raises(SystemExit):
-            parse_arguments(["backtest"])  # Missing --symbol
+        # argparse reports usage errors with exit status 2
+        with pytest.raises(SystemExit, match=r"^2$"):
+            parse_arguments(list(argv))
+
+        assert "usage:" in stderr.getvalue()
 
 
 class TestQuickstartWorkflow:
     """Test quickstart.md workflow scenarios"""
 
-    @pytest.fixture
-    def mock_data_file(self, tmp_path):
-        """Mock data file for testing"""
-        data_file = tmp_path / "data" / "BTCUSDT_1d_100.parquet"
-        data_file.parent.mkdir(exist_ok=True)
-
-        # Create sample data
-        sample_data = pd.DataFrame(
-            {
-                "timestamp": pd.date_range("2024-01-01", periods=100, freq="D"),
-                "open": 47000 + pd.Series(range(100)) * 10,
-                "high": 47000 + pd.Series(range(100)) * 10 + 500,
-                "low": 47000 + pd.Series(range(100)) * 10 - 300,
-                "close": 47000 + pd.Series(range(100)) * 10 + 200,
-                "volume": [1.5] * 100,
-            }
-        )
-        sample_data.to_parquet(data_file)
-        return data_file
-
     def test_quickstart_scenario_1_data_download(self, tmp_path) -> None:
         """Test: python -m src.data.ccxt_client download BTCUSDT 1d 100"""
         # This WILL FAIL - quickstart workflow doesn't exist
@@ -148,18 +195,8 @@ class TestQuickstartWorkflow:
     def test_quickstart_scenario_3_pine_validation(self, tmp_path) -> None:
         """Test: python -m tests.test_pine src/strategies/rsi_basic.pine"""
         # This WILL FAIL - Pine validation workflow doesn't exist
-        pine_script = """
-//@version=6
-strategy("RSI Basic", overlay=true, initial_capital=10000)
-rsi = ta.rsi(close, 14)
-if ta.crossover(rsi, 30)
-    strategy.entry("Long", strategy.long)
-if ta.crossunder(rsi, 70)
-    strategy.close("Long")
-"""
-
         pine_file = tmp_path / "rsi_basic.pine"
-        pine_file.write_text(pine_script)
+        pine_file.write_text(_RSI_BASIC_PINE)
 
         result = quickstart_workflow.validate_pine_script(str(pine_file))
 
@@ -185,22 +222,28 @@ if ta.crossunder(rsi, 70)
             assert "Constitution requirement" in result.output
 
 
+@pytest.fixture(scope="class")
+def base_cli_args() -> argparse.Namespace:
+    """Sample backtest CLI arguments, built once per test class"""
+    return argparse.Namespace(
+        command="backtest",
+        symbol="BTCUSDT",
+        timeframe="1d",
+        initial_capital=10000,
+        commission_rate=0.001,
+        data_dir="data/",
+        output_dir="results/",
+        strategy="rsi_basic",
+    )
+
+
 class TestFullBacktestWorkflow:
     """Test complete backtest workflow integration"""
 
     @pytest.fixture
-    def sample_cli_args(self) -> None:
-        """Sample CLI arguments for testing"""
-        return argparse.Namespace(
-            command="backtest",
-            symbol="BTCUSDT",
-            timeframe="1d",
-            initial_capital=10000,
-            commission_rate=0.001,
-            data_dir="data/",
-            output_dir="results/",
-            strategy="rsi_basic",
-        )
+    def sample_cli_args(self, base_cli_args) -> argparse.Namespace:
+        """Per-test copy of the sample CLI arguments, safe to mutate"""
+        return copy.copy(base_cli_args)
 
     @pytest.mark.skip(reason="Full workflow not implemented - mock assertions failing")
     def test_full_workflow_data_to_results(self, sample_cli_args, tmp_path) -> None:
@@ -208,7 +251,7 @@ class TestFullBacktestWorkflow:
         # This WILL FAIL - full workflow doesn't exist
         pass
 
-    def test_workflow_with_existing_data(self, sample_cli_args, tmp_path) -> None:
+    def test_workflow_with_existing_data(self, sample_cli_args, tmp_path, mocks) -> None:
         """Test workflow when data file already exists"""
         # This WILL FAIL - data existence check doesn't exist
         existing_data = tmp_path / "data" / "BTCUSDT_1d_100.parquet"
@@ -217,31 +260,22 @@ class TestFullBacktestWorkflow:
 
         sample_cli_args.data_dir = str(tmp_path / "data")
 
-        with patch("src.backtest.engine.BacktestEngine") as mock_engine:
-            mock_bt = Mock()
-            mock_result = Mock()
-            mock_bt.run_backtest.return_value = mock_result
-            mock_engine.return_value = mock_bt
-
-            result = full_workflow.execute(sample_cli_args)
+        result = full_workflow.execute(sample_cli_args)
 
-            assert result.success is True
-            assert "Using existing data file" in result.messages
+        assert result.success is True
+        assert "Using existing data file" in result.messages
 
-    def test_workflow_data_download_failure(self, sample_cli_args) -> None:
+    def test_workflow_data_download_failure(self, sample_cli_args, mocks) -> None:
         """Test workflow handling data download failure"""
         # This WILL FAIL - error handling doesn't exist
-        with patch("src.data.ccxt_client.DataDownloader") as mock_downloader:
-            mock_dl = Mock()
-            mock_dl.download.side_effect = Exception("Network error")
-            mock_downloader.return_value = mock_dl
+        mocks.dl.download.side_effect = Exception("Network error")
 
-            result = full_workflow.execute(sample_cli_args)
+        result = full_workflow.execute(sample_cli_args)
 
-            assert result.success is False
-            assert "data download failed" in result.error_message.lower()
+        assert result.success is False
+        assert "data download failed" in result.error_message.lower()
 
-    def test_workflow_invalid_strategy(self, sample_cli_args, tmp_path) -> None:
+    def test_workflow_invalid_strategy(self, sample_cli_args, tmp_path, mocks) -> None:
         """Test workflow with invalid Pine Script strategy"""
         # This WILL FAIL - strategy validation doesn't exist
         invalid_pine = tmp_path / "strategies" / "invalid.pine"
@@ -250,120 +284,92 @@ class TestFullBacktestWorkflow:
 
         sample_cli_args.strategy_file = str(invalid_pine)
 
-        with patch("src.strategies.validator.PineScriptValidator") as mock_validator:
-            mock_val = Mock()
-            mock_val_result = Mock()
-            mock_val_result.is_valid = False
-            mock_val_result.errors = ["Syntax error"]
-            mock_val.validate_file.return_value = mock_val_result
-            mock_validator.return_value = mock_val
+        mocks.val.validate_file.return_value = Mock(is_valid=False, errors=["Syntax error"])
 
-            result = full_workflow.execute(sample_cli_args)
+        result = full_workflow.execute(sample_cli_args)
 
-            assert result.success is False
-            assert "strategy validation failed" in result.error_message.lower()
+        assert result.success is False
+        assert "strategy validation failed" in result.error_message.lower()
 
-    def test_workflow_backtest_execution_failure(self, sample_cli_args, tmp_path) -> None:
+    def test_workflow_backtest_execution_failure(self, sample_cli_args, tmp_path, mocks) -> None:
         """Test workflow handling backtest execution failure"""
         # This WILL FAIL - backtest error handling doesn't exist
-        with (
-            patch("src.data.ccxt_client.DataDownloader") as mock_downloader,
-            patch("src.backtest.engine.BacktestEngine") as mock_engine,
-        ):
-            # Mock successful data download
-            mock_dl = Mock()
-            mock_dl.download.return_value = tmp_path / "BTCUSDT_1d_100.parquet"
-            mock_downloader.return_value = mock_dl
+        # Mock successful data download
+        mocks.dl.download.return_value = tmp_path / "BTCUSDT_1d_100.parquet"
 
-            # Mock backtest failure
-            mock_bt = Mock()
-            mock_bt.run_backtest.side_effect = Exception("Insufficient data")
-            mock_engine.return_value = mock_bt
+        # Mock backtest failure
+        mocks.eng.run_backtest.side_effect = Exception("Insufficient data")
 
-            result = full_workflow.execute(sample_cli_args)
+        result = full_workflow.execute(sample_cli_args)
 
-            assert result.success is False
-            assert "backtest execution failed" in result.error_message.lower()
+        assert result.success is False
+        assert "backtest execution failed" in result.error_message.lower()
 
 
 class TestMainCLIInterface:
     """Test main CLI interface"""
 
-    def test_main_function_backtest_command(self) -> None:
-        """Test main function with backtest command"""
-        # This WILL FAIL - main function doesn't exist
-        with (
-            patch("sys.argv", ["main.py", "backtest", "--symbol", "BTCUSDT"]),
-            patch("src.main.full_workflow") as mock_workflow,
-        ):
-            mock_result = Mock()
-            mock_result.success = True
-            mock_workflow.execute.return_value = mock_result
-
-            exit_code = main()
-
-            assert exit_code == 0
-            mock_workflow.execute.assert_called_once()
-
-    def test_main_function_download_command(self) -> None:
-        """Test main function with download command"""
-        # This WILL FAIL - main function doesn't exist
-        with (
-            patch(
-                "sys.argv",
-                [
-                    "main.py",
-                    "download",
-                    "--symbol",
-                    "BTCUSDT",
-                    "--timeframe",
-                    "1d",
-                    "--limit",
-                    "100",
-                ],
+    _ARGV_BACKTEST: ClassVar[tuple[str, ...]] = ("main.py", "backtest", "--symbol", "BTCUSDT")
+    _ARGV_DOWNLOAD: ClassVar[tuple[str, ...]] = (
+        "main.py",
+        "download",
+        "--symbol",
+        "BTCUSDT",
+        "--timeframe",
+        "1d",
+        "--limit",
+        "100",
+    )
+    _ARGV_VALIDATE: ClassVar[tuple[str, ...]] = ("main.py", "validate", "--file", "strategy.pine")
+
+    @pytest.mark.parametrize(
+        "argv, workflow, method, success, expected_code",
+        [
+            (
+                _ARGV_BACKTEST,
+                "full_workflow",
+                "execute",
+                True,
+                0,
             ),
-            patch("src.main.quickstart_workflow") as mock_workflow,
-        ):
-            mock_result = Mock()
-            mock_result.success = True
-            mock_workflow.data_download.return_value = mock_result
-
-            exit_code = main()
-
-            assert exit_code == 0
-            mock_workflow.data_download.assert_called_once()
-
-    def test_main_function_validate_command(self) -> None:
-        """Test main function with validate command"""
+            (
+                _ARGV_DOWNLOAD,
+                "quickstart_workflow",
+                "data_download",
+                True,
+                0,
+            ),
+            (
+                _ARGV_VALIDATE,
+                "quickstart_workflow",
+                "validate_pine_script",
+                True,
+                0,
+            ),
+            (
+                _ARGV_BACKTEST,
+                "full_workflow",
+                "execute",
+                False,
+                1,
+            ),
+        ],
+        ids=["backtest", "download", "validate", "error_handling"],
+    )
+    def test_main_dispatch(
+        self, monkeypatch, argv, workflow, method, success, expected_code
+    ) -> None:
+        """Test main function dispatches each command to its workflow"""
         # This WILL FAIL - main function doesn't exist
-        with (
-            patch("sys.argv", ["main.py", "validate", "--file", "strategy.pine"]),
-            patch("src.main.quickstart_workflow") as mock_workflow,
-        ):
-            mock_result = Mock()
-            mock_result.success = True
-            mock_workflow.validate_pine_script.return_value = mock_result
-
-            exit_code = main()
-
-            assert exit_code == 0
-            mock_workflow.validate_pine_script.assert_called_once()
-
-    def test_main_function_error_handling(self) -> None:
-        """Test main function error handling"""
-        # This WILL FAIL - error handling doesn't exist
-        with (
-            patch("sys.argv", ["main.py", "backtest", "--symbol", "BTCUSDT"]),
-            patch("src.main.full_workflow") as mock_workflow,
-        ):
-            mock_result = Mock()
-            mock_result.success = False
-            mock_result.error_message = "Test error"
-            mock_workflow.execute.return_value = mock_result
+        monkeypatch.setattr(sys, "argv", list(argv))
+        with patch(f"src.main.{workflow}") as mock_workflow:
+            workflow_method = getattr(mock_workflow, method)
+            workflow_method.return_value = Mock(success=success, error_message="Test error")
 
             exit_code = main()
 
-            assert exit_code != 0
+            assert exit_code == expected_code
+            workflow_method.assert_called_once()
 
 
 class TestBacktestCLI:
@@ -430,102 +436,88 @@ class TestBacktestCLI:
 class TestErrorHandling:
     """Test comprehensive error handling across integration"""
 
-    def test_network_error_handling(self) -> None:
-        """Test handling of network errors during data download"""
-        # This WILL FAIL - network error handling doesn't exist
+    @pytest.mark.parametrize(
+        "target,error,message,retry_suggested",
+        [
+            # Network errors during data download
+            ("dl.download", ConnectionError("Network unreachable"), "network", True),
+            # Disk space errors while saving downloaded data
+            ("dl.download", OSError("No space left on device"), "disk space", False),
+            # Invalid/corrupted data rejected by the backtest
+            ("eng.run_backtest", ValueError("Invalid OHLCV data"), "invalid data", False),
+        ],
+    )
+    def test_workflow_error_handling(self, mocks, target, error, message, retry_suggested) -> None:
+        """Test workflow errors are reported with a descriptive message"""
+        # This WILL FAIL - error handling doesn't exist
         args = argparse.Namespace(command="backtest", symbol="BTCUSDT", timeframe="1d")
 
-        with patch("src.data.ccxt_client.DataDownloader") as mock_downloader:
-            mock_dl = Mock()
-            mock_dl.download.side_effect = ConnectionError("Network unreachable")
-            mock_downloader.return_value = mock_dl
-
-            result = full_workflow.execute(args)
-
-            assert result.success is False
-            assert "network" in result.error_message.lower()
-            assert result.retry_suggested is True
-
-    def test_disk_space_error_handling(self) -> None:
-        """Test handling of disk space errors"""
-        # This WILL FAIL - disk space error handling doesn't exist
-        args = argparse.Namespace(command="backtest", symbol="BTCUSDT")
-
-        with patch("src.data.ccxt_client.DataDownloader") as mock_downloader:
-            mock_dl = Mock()
-            mock_dl.download.side_effect = OSError("No space left on device")
-            mock_downloader.return_value = mock_dl
-
-            result = full_workflow.execute(args)
-
-            assert result.success is False
-            assert "disk space" in result.error_message.lower()
-
-    def test_invalid_data_error_handling(self) -> None:
-        """Test handling of invalid/corrupted data"""
-        # This WILL FAIL - data validation doesn't exist
-        args = argparse.Namespace(command="backtest", symbol="BTCUSDT")
-
-        with (
-            patch("src.data.ccxt_client.DataDownloader") as mock_downloader,
-            patch("src.backtest.engine.BacktestEngine") as mock_engine,
-        ):
-            # Mock data download success
-            mock_dl = Mock()
-            mock_dl.download.return_value = Path("data.parquet")
-            mock_downloader.return_value = mock_dl
+        mock_name, method = target.split(".")
+        mocks.dl.download.return_value = Path("data.parquet")
+        getattr(getattr(mocks, mock_name), method).side_effect = error
 
-            # Mock backtest failure due to invalid data
-            mock_bt = Mock()
-            mock_bt.run_backtest.side_effect = ValueError("Invalid OHLCV data")
-            mock_engine.return_value = mock_bt
+        result = full_workflow.execute(args)
 
-            result = full_workflow.execute(args)
+        assert result.success is False
+        assert message in result.error_message.lower()
+        assert result.retry_suggested is retry_suggested
 
-            assert result.success is False
-            assert "invalid data" in result.error_message.lower()
-
-    def test_strategy_compilation_error(self) -> None:
+    def test_strategy_compilation_error(self, mocks) -> None:
         """Test handling of Pine Script compilation errors"""
         # This WILL FAIL - compilation error handling doesn't exist
         args = argparse.Namespace(
             command="backtest", symbol="BTCUSDT", strategy_file="invalid.pine"
         )
 
-        with patch("src.strategies.validator.PineScriptValidator") as mock_validator:
-            mock_val = Mock()
-            mock_val_result = Mock()
-            mock_val_result.is_valid = False
-            mock_val_result.errors = ["Compilation error: Invalid syntax"]
-            mock_val.validate_file.return_value = mock_val_result
-            mock_validator.return_value = mock_val
+        mocks.val.validate_file.return_value = Mock(
+            is_valid=False, errors=["Compilation error: Invalid syntax"]
+        )
+
+        result = full_workflow.execute(args)
+
+        assert result.success is False
+        assert "compilation" in result.error_message.lower()
+
+
+# Canned pytest-cov report; running the real suite from inside it recurses
+_COVERAGE_REPORT: Final[str] = """
+Name                      Stmts   Miss  Cover   Missing
+-------------------------------------------------------
+src/main.py                 200     26    87%   12-20
+-------------------------------------------------------
+TOTAL                       200     26    87%
+"""
 
-            result = full_workflow.execute(args)
 
-            assert result.success is False
-            assert "compilation" in result.error_message.lower()
+@pytest.fixture(scope="session")
+def coverage_result():
+    """Run verify_coverage once against the canned report and share the result"""
+    with patch("subprocess.run", return_value=Mock(stdout=_COVERAGE_REPORT)) as mock_run:
+        result = quickstart_workflow.verify_coverage()
+    mock_run.assert_called_once()
+    return result
 
 
 class TestCoverageValidation:
     """Test coverage validation requirements"""
 
-    @pytest.mark.skip(reason="Coverage validation causes infinite recursion")
-    def test_95_percent_coverage_requirement(self) -> None:
+    def test_95_percent_coverage_requirement(self, coverage_result) -> None:
         """Test that 95% coverage requirement is enforced"""
         # This WILL FAIL - coverage validation doesn't exist
-        pass
+        assert coverage_result.coverage_percentage == 87.0
+        assert coverage_result.constitution_compliant is False
 
-    @pytest.mark.skip(reason="Coverage validation causes infinite recursion")
-    def test_coverage_reporting_format(self) -> None:
+    def test_coverage_reporting_format(self, coverage_result) -> None:
         """Test coverage reporting matches expected format"""
         # This WILL FAIL - coverage reporting doesn't exist
-        pass
+        assert "Test Coverage: 87.0%" in coverage_result.output
+        assert "requirement not met (<95%)" in coverage_result.output
 
-    @pytest.mark.skip(reason="Coverage validation causes infinite recursion")
-    def test_coverage_failure_handling(self) -> None:
+    def test_coverage_failure_handling(self, coverage_result) -> None:
         """Test handling when coverage is below 95%"""
         # This WILL FAIL - coverage failure handling doesn't exist
-        pass
+        assert coverage_result.success is False
+        assert coverage_result.error_message == "Constitution requirement not met"
 
 
 # These tests WILL ALL FAIL initially because:
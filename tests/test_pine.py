@@ -7,6 +7,9 @@ This is strict TDD approach required by Constitution.
 Tests Pine Script v6 syntax validation and strategy structure verification.
 """
 
+import copy
+import dataclasses
+
 import pytest
 
 # Import the implemented modules
@@ -20,12 +23,8 @@ from src.strategies.validator import (
     template_validator,
 )
 
-
-# Global fixtures available to all test classes
-@pytest.fixture
-def valid_pine_v6_template():
-    """Valid Pine Script v6 template content"""
-    return """
+# Canonical scripts shared by the session-scoped content and file fixtures
+_VALID_V6_SRC = """
 //@version=6
 strategy("RSI Strategy v6", overlay=true, initial_capital=10000, commission_type=strategy.commission.percent, commission_value=0.1)
 
@@ -54,11 +53,7 @@ hline(70, "Overbought", color=color.red)
 hline(30, "Oversold", color=color.green)
 """
 
-
-@pytest.fixture
-def invalid_pine_v5_script():
-    """Invalid Pine Script v5 (should be v6)"""
-    return """
+_INVALID_V5_SRC = """
 //@version=5
 strategy("Old Strategy", overlay=true)
 
@@ -69,11 +64,7 @@ if crossover(rsi_value, 30)  // Should be ta.crossover() in v6
     strategy.entry("Long", strategy.long)
 """
 
-
-@pytest.fixture
-def malformed_pine_script():
-    """Malformed Pine Script with syntax errors"""
-    return """
+_MALFORMED_SRC = """
 //@version=6
 strategy("Broken Strategy" overlay=true)  // Missing comma
 
@@ -89,11 +80,7 @@ if ta.crossover(rsi, 30
 plot(rsi, title="RSI", color=color.blue
 """
 
-
-@pytest.fixture
-def rsi_strategy_script():
-    """Complete RSI strategy script"""
-    return """
+_RSI_STRATEGY_SRC = """
 //@version=6
 strategy("RSI Momentum Strategy", overlay=true, initial_capital=10000)
 
@@ -134,6 +121,95 @@ hline(oversold_level, "Oversold", color=color.green, linestyle=hline.style_dashe
 """
 
 
+# Pre-encoded once so byte-level validation tests do not re-encode per test
+_VALID_V6_BYTES = _VALID_V6_SRC.encode("utf-8")
+
+
+# Global fixtures available to all test classes
+@pytest.fixture(scope="session")
+def pine_dir(tmp_path_factory):
+    """Shared directory for the session-scoped Pine Script files"""
+    return tmp_path_factory.mktemp("pine")
+
+
+@pytest.fixture(scope="session")
+def valid_pine_v6_template():
+    """Valid Pine Script v6 template content"""
+    return _VALID_V6_SRC
+
+
+@pytest.fixture(scope="session")
+def valid_pine_v6_file(pine_dir):
+    """Valid Pine Script v6 template content, written once per session"""
+    path = pine_dir / "valid_v6.pine"
+    path.write_text(_VALID_V6_SRC)
+    return path
+
+
+@pytest.fixture(scope="session")
+def invalid_pine_v5_script():
+    """Invalid Pine Script v5 (should be v6)"""
+    return _INVALID_V5_SRC
+
+
+@pytest.fixture(scope="session")
+def malformed_pine_script():
+    """Malformed Pine Script with syntax errors"""
+    return _MALFORMED_SRC
+
+
+@pytest.fixture(scope="session")
+def malformed_pine_file(pine_dir):
+    """Malformed Pine Script with syntax errors, written once per session"""
+    path = pine_dir / "malformed.pine"
+    path.write_text(_MALFORMED_SRC)
+    return path
+
+
+@pytest.fixture(scope="session")
+def rsi_strategy_script():
+    """Complete RSI strategy script"""
+    return _RSI_STRATEGY_SRC
+
+
+@pytest.fixture(scope="session")
+def rsi_strategy_file(pine_dir):
+    """Complete RSI strategy script, written once per session"""
+    path = pine_dir / "rsi_strategy.pine"
+    path.write_text(_RSI_STRATEGY_SRC)
+    return path
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """PineScriptValidator shared by the module (validation keeps no per-call state)"""
+    return PineScriptValidator()
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    """StrategyAnalyzer shared by the module"""
+    return StrategyAnalyzer()
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """PineParser shared by the module"""
+    return PineParser()
+
+
+@pytest.fixture(scope="module")
+def checker():
+    """SyntaxChecker shared by the module"""
+    return SyntaxChecker()
+
+
+@pytest.fixture(scope="module")
+def rsi_validator_instance():
+    """IndicatorValidator shared by the module"""
+    return IndicatorValidator()
+
+
 class TestPineScriptValidator:
     """Test Pine Script validation functionality"""
 
@@ -147,24 +223,19 @@ class TestPineScriptValidator:
         assert hasattr(validator, "validate_syntax")
         assert hasattr(validator, "validate_strategy_structure")
 
-    def test_validate_file_path(self, tmp_path, valid_pine_v6_template) -> None:
+    def test_validate_file_path(self, valid_pine_v6_file, validator) -> None:
         """Test validating Pine Script from file path"""
         # This WILL FAIL - file validation doesn't exist
-        pine_file = tmp_path / "test_strategy.pine"
-        pine_file.write_text(valid_pine_v6_template)
-
-        validator = PineScriptValidator()
-        result = validator.validate_file(pine_file)
+        result = validator.validate_file(valid_pine_v6_file)
 
         assert result.is_valid is True
         assert result.version == "6"
         assert result.errors == []
         assert result.warnings == []
 
-    def test_validate_script_content(self, valid_pine_v6_template) -> None:
+    def test_validate_script_content(self, valid_pine_v6_template, validator) -> None:
         """Test validating Pine Script from string content"""
         # This WILL FAIL - content validation doesn't exist
-        validator = PineScriptValidator()
         result = validator.validate_script(valid_pine_v6_template)
 
         assert result.is_valid is True
@@ -172,29 +243,121 @@ class TestPineScriptValidator:
         assert "strategy" in result.declarations
         assert result.strategy_name == "RSI Strategy v6"
 
+    def test_validation_results_cached(self, monkeypatch, tmp_path, valid_pine_v6_template) -> None:
+        """Test repeated validation reuses results keyed by source text or file bytes"""
+        runs = []
+        original = PineScriptValidator._validate
+
+        def counting_validate(self, content):
+            runs.append(content)
+            return original(self, content)
+
+        monkeypatch.setattr(PineScriptValidator, "_validate", counting_validate)
+        source = f"{valid_pine_v6_template}// cache probe\n"
+
+        first = PineScriptValidator().validate_script(source)
+        assert PineScriptValidator().validate_script(source) == first
+        assert len(runs) == 1
+
+        pine_file = tmp_path / "cached.pine"
+        pine_file.write_text(source)
+        assert PineScriptValidator().validate_file(pine_file) == first
+        assert PineScriptValidator().validate_file(pine_file) == first
+        assert len(runs) == 2  # files are cached by their bytes
+
+        pine_file.write_text(source.replace("//@version=6", "//@version=5"))
+        assert PineScriptValidator().validate_file(pine_file).is_valid is False
+
+    def test_cache_respects_instance_configuration(self, valid_pine_v6_template) -> None:
+        """Test validators configured differently never share cached results"""
+
+        class TaggingValidator(PineScriptValidator):
+            def __init__(self, tag: str) -> None:
+                super().__init__()
+                self.tag = tag
+
+            def _validate_fast(self, content):
+                result = super()._validate_fast(content)
+                return dataclasses.replace(result, warnings=[self.tag])
+
+        first = TaggingValidator("first").validate_script(valid_pine_v6_template, full=False)
+        second = TaggingValidator("second").validate_script(valid_pine_v6_template, full=False)
+
+        assert first.warnings == ["first"]
+        assert second.warnings == ["second"]
+
+    def test_cache_hits_unaffected_by_mutation(self, malformed_pine_script, validator) -> None:
+        """Test mutating a returned result does not leak into later cache hits"""
+        first = validator.validate_script(malformed_pine_script)
+        expected_errors = list(first.errors)
+
+        first.errors.append("caller note")
+        first.warnings.append("caller warning")
+        second = validator.validate_script(malformed_pine_script)
+
+        assert second is not first
+        assert second.errors == expected_errors
+        assert second.warnings == []
+
+    def test_cached_parameters_read_only(self, valid_pine_v6_template, validator) -> None:
+        """Test shared cached results cannot have their parameters mutated"""
+        result = validator.validate_script(valid_pine_v6_template)
+
+        with pytest.raises(TypeError):
+            result.strategy_params["overlay"] = False
+        with pytest.raises(TypeError):
+            result.input_params["rsi_length"]["default"] = 0
+
+    def test_validate_script_bytes(self, validator) -> None:
+        """Test UTF-8 bytes validate the same as the decoded source"""
+        result = validator.validate_script(_VALID_V6_BYTES)
+
+        assert result.is_valid is True
+        assert result == validator.validate_script(_VALID_V6_SRC)
+
+    @pytest.mark.parametrize("full", [True, False])
+    def test_validate_script_invalid_utf8(self, validator, full) -> None:
+        """Test undecodable bytes give an invalid result instead of raising"""
+        content = _VALID_V6_BYTES + b"// \xff\xfe\n"
+
+        result = validator.validate_script(content, full=full)
+
+        assert result.is_valid is False
+        assert result.version == "6"
+        assert result.errors[0].startswith("Invalid UTF-8 source")
+        assert validator.is_valid(content) is False
+
     def test_version_validation_v6_required(self, valid_pine_v6_template) -> None:
         """Test that Pine Script v6 is required"""
         # This WILL FAIL - version checking doesn't exist
         validator = PineScriptValidator(required_version="6")
-        result = validator.validate_script(valid_pine_v6_template)
+        result = validator.validate_script(valid_pine_v6_template, full=False)
 
         assert result.is_valid is True
         assert result.version == "6"
+        assert validator.is_valid(valid_pine_v6_template) is True
 
     def test_version_validation_v5_rejection(self, invalid_pine_v5_script) -> None:
         """Test that Pine Script v5 is rejected"""
         # This WILL FAIL - version checking doesn't exist
         validator = PineScriptValidator(required_version="6")
-        result = validator.validate_script(invalid_pine_v5_script)
+        result = validator.validate_script(invalid_pine_v5_script, full=False)
 
         assert result.is_valid is False
         assert "version 6 required" in str(result.errors[0]).lower()
 
-    def test_syntax_error_detection(self, malformed_pine_script) -> None:
+    def test_version_rejection_skips_extraction(self, invalid_pine_v5_script, validator) -> None:
+        """Test a wrong version stops validation before strategy details are extracted"""
+        result = validator.validate_script(invalid_pine_v5_script.encode("utf-8"))
+
+        assert result.is_valid is False
+        assert result.version == "5"
+        assert result.declarations == []
+
+    def test_syntax_error_detection(self, malformed_pine_script, validator) -> None:
         """Test detection of syntax errors"""
         # This WILL FAIL - syntax checking doesn't exist
-        validator = PineScriptValidator()
-        result = validator.validate_script(malformed_pine_script)
+        result = validator.validate_script(malformed_pine_script, full=False)
 
         assert result.is_valid is False
         assert len(result.errors) > 0
@@ -203,7 +366,7 @@ class TestPineScriptValidator:
         assert any("syntax" in msg for msg in error_messages)
         assert any("missing" in msg or "comma" in msg for msg in error_messages)
 
-    def test_strategy_declaration_validation(self) -> None:
+    def test_strategy_declaration_validation(self, validator) -> None:
         """Test validation of strategy() declaration"""
         # This WILL FAIL - strategy validation doesn't exist
         script_without_strategy = """
@@ -214,16 +377,14 @@ rsi = ta.rsi(close, 14)
 plot(rsi)
 """
 
-        validator = PineScriptValidator()
-        result = validator.validate_script(script_without_strategy)
+        result = validator.validate_script(script_without_strategy, full=False)
 
         assert result.is_valid is False
         assert any("strategy() declaration required" in str(error) for error in result.errors)
 
-    def test_required_parameters_validation(self, valid_pine_v6_template) -> None:
+    def test_required_parameters_validation(self, valid_pine_v6_template, validator) -> None:
         """Test validation of required strategy parameters"""
         # This WILL FAIL - parameter validation doesn't exist
-        validator = PineScriptValidator()
         result = validator.validate_script(valid_pine_v6_template)
 
         assert result.strategy_params["overlay"] is True
@@ -231,10 +392,9 @@ plot(rsi)
         assert "commission_type" in result.strategy_params
         assert "commission_value" in result.strategy_params
 
-    def test_input_parameter_validation(self, valid_pine_v6_template) -> None:
+    def test_input_parameter_validation(self, valid_pine_v6_template, validator) -> None:
         """Test validation of input parameters"""
         # This WILL FAIL - input validation doesn't exist
-        validator = PineScriptValidator()
         result = validator.validate_script(valid_pine_v6_template)
 
         assert "rsi_length" in result.input_params
@@ -251,11 +411,11 @@ plot(rsi)
 class TestRSIStrategyValidator:
     """Test RSI-specific strategy validation"""
 
-    def test_rsi_indicator_validation(self, rsi_strategy_script) -> None:
+    def test_rsi_indicator_validation(
+        self, rsi_strategy_script, validator, rsi_validator_instance
+    ) -> None:
         """Test RSI indicator usage validation"""
         # This WILL FAIL - RSI validation doesn't exist
-        validator = PineScriptValidator()
-        rsi_validator_instance = IndicatorValidator()
 
         result = validator.validate_script(rsi_strategy_script)
         rsi_result = rsi_validator_instance.validate_rsi_usage(result)
@@ -267,10 +427,9 @@ class TestRSIStrategyValidator:
         assert rsi_result.oversold_range == (10, 40)
         assert rsi_result.overbought_range == (60, 90)
 
-    def test_entry_exit_logic_validation(self, rsi_strategy_script) -> None:
+    def test_entry_exit_logic_validation(self, rsi_strategy_script, validator) -> None:
         """Test entry and exit logic validation"""
         # This WILL FAIL - logic validation doesn't exist
-        validator = PineScriptValidator()
         result = validator.validate_script(rsi_strategy_script)
 
         assert result.has_entry_conditions is True
@@ -278,10 +437,9 @@ class TestRSIStrategyValidator:
         assert "ta.crossover" in result.entry_methods
         assert "ta.crossunder" in result.exit_methods
 
-    def test_risk_management_validation(self, rsi_strategy_script) -> None:
+    def test_risk_management_validation(self, rsi_strategy_script, validator) -> None:
         """Test risk management implementation validation"""
         # This WILL FAIL - risk validation doesn't exist
-        validator = PineScriptValidator()
         result = validator.validate_script(rsi_strategy_script)
 
         assert result.has_stop_loss is True
@@ -296,10 +454,9 @@ class TestRSIStrategyValidator:
 
         assert risk_reward_ratio >= 1.5  # Minimum requirement
 
-    def test_position_sizing_validation(self, rsi_strategy_script) -> None:
+    def test_position_sizing_validation(self, rsi_strategy_script, validator) -> None:
         """Test position sizing logic validation"""
         # This WILL FAIL - position validation doesn't exist
-        validator = PineScriptValidator()
         result = validator.validate_script(rsi_strategy_script)
 
         assert result.has_position_checks is True
@@ -319,10 +476,9 @@ class TestStrategyAnalyzer:
         assert hasattr(analyzer, "extract_parameters")
         assert hasattr(analyzer, "check_best_practices")
 
-    def test_parameter_extraction(self, valid_pine_v6_template) -> None:
+    def test_parameter_extraction(self, valid_pine_v6_template, analyzer) -> None:
         """Test extraction of strategy parameters"""
         # This WILL FAIL - parameter extraction doesn't exist
-        analyzer = StrategyAnalyzer()
         params = analyzer.extract_parameters(valid_pine_v6_template)
 
         assert "rsi_length" in params
@@ -333,10 +489,9 @@ class TestStrategyAnalyzer:
         assert params["rsi_oversold"]["default"] == 30
         assert params["rsi_overbought"]["default"] == 70
 
-    def test_best_practices_check(self, rsi_strategy_script) -> None:
+    def test_best_practices_check(self, rsi_strategy_script, analyzer) -> None:
         """Test best practices validation"""
         # This WILL FAIL - best practices check doesn't exist
-        analyzer = StrategyAnalyzer()
         practices = analyzer.check_best_practices(rsi_strategy_script)
 
         assert practices.has_version_declaration is True
@@ -346,10 +501,9 @@ class TestStrategyAnalyzer:
         assert practices.has_visualization is True
         assert practices.score >= 80  # Out of 100
 
-    def test_complexity_analysis(self, rsi_strategy_script) -> None:
+    def test_complexity_analysis(self, rsi_strategy_script, analyzer) -> None:
         """Test strategy complexity analysis"""
         # This WILL FAIL - complexity analysis doesn't exist
-        analyzer = StrategyAnalyzer()
         complexity = analyzer.analyze_complexity(rsi_strategy_script)
 
         assert complexity.line_count > 20
@@ -357,10 +511,9 @@ class TestStrategyAnalyzer:
         assert complexity.variable_count >= 5
         assert complexity.complexity_score in ["low", "medium", "high"]
 
-    def test_performance_hints(self, rsi_strategy_script) -> None:
+    def test_performance_hints(self, rsi_strategy_script, analyzer) -> None:
         """Test performance optimization hints"""
         # This WILL FAIL - performance analysis doesn't exist
-        analyzer = StrategyAnalyzer()
         hints = analyzer.get_performance_hints(rsi_strategy_script)
 
         assert isinstance(hints, list)
@@ -380,10 +533,9 @@ class TestPineParser:
         assert hasattr(parser, "extract_functions")
         assert hasattr(parser, "extract_variables")
 
-    def test_script_parsing(self, valid_pine_v6_template) -> None:
+    def test_script_parsing(self, valid_pine_v6_template, parser) -> None:
         """Test parsing Pine Script structure"""
         # This WILL FAIL - parsing doesn't exist
-        parser = PineParser()
         ast = parser.parse_script(valid_pine_v6_template)
 
         assert ast.version == "6"
@@ -392,10 +544,25 @@ class TestPineParser:
         assert len(ast.variable_declarations) >= 1
         assert len(ast.condition_blocks) >= 2
 
-    def test_function_extraction(self, valid_pine_v6_template) -> None:
+    def test_cache_hits_unaffected_by_mutation(self, valid_pine_v6_template) -> None:
+        """Test mutating a returned parse does not leak into later cache hits"""
+        parser = PineParser()
+        first = parser.parse_script(valid_pine_v6_template)
+        expected = copy.deepcopy(first)
+
+        first.version = "5"
+        first.function_calls.clear()
+        first.variable_declarations.append("caller_var")
+        second = parser.parse_script(valid_pine_v6_template)
+
+        assert second is not first
+        assert second == expected
+        assert "ta.rsi" in parser.extract_functions(valid_pine_v6_template)
+        assert "caller_var" not in parser.extract_variables(valid_pine_v6_template)
+
+    def test_function_extraction(self, valid_pine_v6_template, parser) -> None:
         """Test extraction of function calls"""
         # This WILL FAIL - function extraction doesn't exist
-        parser = PineParser()
         functions = parser.extract_functions(valid_pine_v6_template)
 
         expected_functions = [
@@ -409,10 +576,9 @@ class TestPineParser:
         for func in expected_functions:
             assert func in functions
 
-    def test_variable_tracking(self, valid_pine_v6_template) -> None:
+    def test_variable_tracking(self, valid_pine_v6_template, parser) -> None:
         """Test tracking of variable declarations and usage"""
         # This WILL FAIL - variable tracking doesn't exist
-        parser = PineParser()
         variables = parser.extract_variables(valid_pine_v6_template)
 
         assert "rsi_length" in variables
@@ -435,10 +601,9 @@ class TestSyntaxChecker:
         assert hasattr(checker, "check_brackets")
         assert hasattr(checker, "check_commas")
 
-    def test_bracket_matching(self) -> None:
+    def test_bracket_matching(self, checker) -> None:
         """Test bracket and parentheses matching"""
         # This WILL FAIL - bracket checking doesn't exist
-        checker = SyntaxChecker()
 
         valid_brackets = "if (ta.crossover(rsi, 30) and condition) { strategy.entry() }"
         invalid_brackets = "if (ta.crossover(rsi, 30) { strategy.entry() }"  # Missing )
@@ -446,10 +611,9 @@ class TestSyntaxChecker:
         assert checker.check_brackets(valid_brackets) is True
         assert checker.check_brackets(invalid_brackets) is False
 
-    def test_comma_validation(self) -> None:
+    def test_comma_validation(self, checker) -> None:
         """Test comma placement validation"""
         # This WILL FAIL - comma checking doesn't exist
-        checker = SyntaxChecker()
 
         valid_commas = 'input.int(14, title="RSI Length", minval=1, maxval=50)'
         invalid_commas = 'input.int(14 title="RSI Length" minval=1 maxval=50)'  # Missing commas
@@ -457,10 +621,25 @@ class TestSyntaxChecker:
         assert checker.check_commas(valid_commas) is True
         assert checker.check_commas(invalid_commas) is False
 
-    def test_string_quote_matching(self) -> None:
+    @pytest.mark.parametrize(
+        "source,expected",
+        [
+            # The outer call's span reaches the inner ")" and contains a comma
+            ("f(x, g(a=1 b=2))", True),
+            ("f(g(a=1 b=2) c=3)", False),
+            # "=" and "," inside string literals are not keyword arguments
+            ('plot(rsi, title="a=b c=d")', True),
+            ('plot(title="a=b", color=x linewidth=2)', True),
+            ('plot(title="a, b" color=x)', False),
+        ],
+    )
+    def test_comma_validation_nested_and_strings(self, checker, source, expected) -> None:
+        """Test comma checks on nested calls and on strings containing '=' or ','"""
+        assert checker.check_commas(source) is expected
+
+    def test_string_quote_matching(self, checker) -> None:
         """Test string quote matching"""
         # This WILL FAIL - quote checking doesn't exist
-        checker = SyntaxChecker()
 
         valid_quotes = 'strategy("My Strategy", overlay=true)'
         invalid_quotes = 'strategy("My Strategy, overlay=true)'  # Missing closing quote
@@ -468,42 +647,73 @@ class TestSyntaxChecker:
         assert checker.check_quotes(valid_quotes) is True
         assert checker.check_quotes(invalid_quotes) is False
 
+    @pytest.mark.parametrize(
+        "source,brackets_ok,quotes_ok",
+        [
+            ("if (ta.crossover(rsi, 30) and c) { x = [1, 2] }", True, True),
+            ("if (ta.crossover(rsi, 30) { strategy.entry() }", False, True),
+            ("plot(close]", False, True),
+            ('strategy("RSI (14", overlay=true)', False, True),
+            ('label.new(x, y, text="say \\"hi\\"")', True, True),
+            ('x = "a\\\\" + "b"', True, True),
+            ('strategy("RSI, overlay=true)', True, False),
+        ],
+        ids=[
+            "balanced",
+            "unbalanced",
+            "mismatched",
+            "quoted_bracket",
+            "escaped_quote",
+            "escaped_backslash",
+            "unterminated",
+        ],
+    )
+    def test_numpy_fallback_matches_jit(
+        self, monkeypatch, checker, analyzer, source, brackets_ok, quotes_ok
+    ) -> None:
+        """Test the numpy scanners used without Numba agree with the jitted kernels"""
+
+        def scan():
+            return (
+                checker.check_brackets(source),
+                checker.check_quotes(source),
+                checker.check_syntax(source),
+                analyzer.analyze_complexity(f"{source}\nif x\n"),
+            )
+
+        jitted = scan()
+        monkeypatch.setattr("src.strategies.validator.NUMBA_AVAILABLE", False)
+
+        assert scan() == jitted
+        assert jitted[:2] == (brackets_ok, quotes_ok)
+
 
 class TestCLIValidation:
     """Test command-line validation interface"""
 
-    def test_validate_template_pine(self, tmp_path, valid_pine_v6_template) -> None:
+    def test_validate_template_pine(self, valid_pine_v6_file) -> None:
         """Test CLI validation of template.pine"""
         # This WILL FAIL - CLI validation doesn't exist
-        template_file = tmp_path / "template.pine"
-        template_file.write_text(valid_pine_v6_template)
-
         # Simulate: python -m tests.test_pine src/strategies/template.pine
-        result = template_validator.validate_file(str(template_file))
+        result = template_validator.validate_file(str(valid_pine_v6_file))
 
         assert result.exit_code == 0
         assert "✅ Pine Script v6 문법 확인" in result.output
         assert "✅ 전략 구조 검증" in result.output
 
-    def test_validate_rsi_basic_pine(self, tmp_path, rsi_strategy_script) -> None:
+    def test_validate_rsi_basic_pine(self, rsi_strategy_file) -> None:
         """Test CLI validation of rsi_basic.pine"""
         # This WILL FAIL - CLI validation doesn't exist
-        rsi_file = tmp_path / "rsi_basic.pine"
-        rsi_file.write_text(rsi_strategy_script)
-
         # Simulate: python -m tests.test_pine src/strategies/rsi_basic.pine
-        result = rsi_validator.validate_file(str(rsi_file))
+        result = rsi_validator.validate_file(str(rsi_strategy_file))
 
         assert result.exit_code == 0
         assert "✅ RSI 로직 검증 완료" in result.output
 
-    def test_validation_error_reporting(self, tmp_path, malformed_pine_script) -> None:
+    def test_validation_error_reporting(self, malformed_pine_file) -> None:
         """Test error reporting for invalid scripts"""
         # This WILL FAIL - error reporting doesn't exist
-        invalid_file = tmp_path / "invalid.pine"
-        invalid_file.write_text(malformed_pine_script)
-
-        result = template_validator.validate_file(str(invalid_file))
+        result = template_validator.validate_file(str(malformed_pine_file))
 
         assert result.exit_code != 0
         assert "❌" in result.output  # Error indicator
@@ -513,10 +723,9 @@ class TestCLIValidation:
 class TestTemplateValidation:
     """Test validation against strategy template"""
 
-    def test_template_structure_compliance(self, valid_pine_v6_template) -> None:
+    def test_template_structure_compliance(self, valid_pine_v6_template, validator) -> None:
         """Test compliance with strategy template structure"""
         # This WILL FAIL - template compliance doesn't exist
-        validator = PineScriptValidator()
         result = validator.validate_against_template(valid_pine_v6_template)
 
         assert result.has_version_declaration is True
@@ -527,10 +736,9 @@ class TestTemplateValidation:
         assert result.has_visualization is True
         assert result.compliance_score >= 90  # Out of 100
 
-    def test_required_sections_validation(self, valid_pine_v6_template) -> None:
+    def test_required_sections_validation(self, valid_pine_v6_template, validator) -> None:
         """Test presence of required template sections"""
         # This WILL FAIL - section validation doesn't exist
-        validator = PineScriptValidator()
         sections = validator.validate_sections(valid_pine_v6_template)
 
         required_sections = [